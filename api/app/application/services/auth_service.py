@@ -6,10 +6,10 @@ from typing import Optional
 from app.domain.models.user import User, UserRole, UserStatus
 from app.domain.repositories.user_repository import UserRepository
 from core.security import (
+    aget_password_hash,
+    averify_password,
     create_tokens,
     decode_token,
-    get_password_hash,
-    verify_password,
 )
 
 logger = logging.getLogger(__name__)
@@ -66,7 +66,7 @@ class AuthService:
         user = User(
             username=username,
             email=email,
-            password_hash=get_password_hash(password),
+            password_hash=await aget_password_hash(password),
             nickname=nickname or username or email.split("@")[0] if email else None,
             role=UserRole.USER,
             status=UserStatus.ACTIVE,
@@ -114,7 +114,7 @@ class AuthService:
         if not user.password_hash:
             raise ValueError("该账户未设置密码，请使用第三方登录")
 
-        if not verify_password(password, user.password_hash):
+        if not await averify_password(password, user.password_hash):
             raise ValueError("密码错误")
 
         if not user.is_active():
@@ -61,6 +61,29 @@ class SessionService:
             await self._get_accessible_session(session_id, user_id, is_admin=is_admin)
             await self._uow.session.update_unread_message_count(session_id, 0)
 
+    async def clear_unread_message_counts(
+        self, session_ids: List[str], user_id: str, is_admin: bool = False
+    ) -> None:
+        """批量清空指定会话未读消息数，所有会话在同一个事务内完成校验与更新"""
+        logger.info(f"批量清除会话未读消息数, 会话数: {len(session_ids)}")
+        async with self._uow:
+            for session_id in session_ids:
+                await self._get_accessible_session(
+                    session_id, user_id, is_admin=is_admin
+                )
+            for session_id in session_ids:
+                await self._uow.session.update_unread_message_count(session_id, 0)
+
+    async def check_sessions_access(
+        self, session_ids: List[str], user_id: str, is_admin: bool = False
+    ) -> None:
+        """批量校验会话是否存在且可访问，任一会话不通过即抛出异常"""
+        async with self._uow:
+            for session_id in session_ids:
+                await self._get_accessible_session(
+                    session_id, user_id, is_admin=is_admin
+                )
+
     async def delete_session(
         self, session_id: str, user_id: str, is_admin: bool = False
     ) -> None:
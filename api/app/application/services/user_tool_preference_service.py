@@ -17,6 +17,8 @@ class UserToolPreferenceService:
     管理用户对 MCP/A2A 工具的个人启用/禁用偏好
     """
 
+    __slots__ = ("preference_repository",)
+
     def __init__(self, preference_repository: UserToolPreferenceRepository) -> None:
         self.preference_repository = preference_repository
 
@@ -110,6 +112,31 @@ class UserToolPreferenceService:
         )
         return result
 
+    async def set_tools_enabled(
+        self,
+        user_id: str,
+        tool_type: ToolType,
+        enabled_map: dict[str, bool],
+    ) -> int:
+        """批量设置用户对多个工具的启用状态
+
+        Args:
+            user_id: 用户 ID
+            tool_type: 工具类型
+            enabled_map: 工具 ID 到启用状态的映射
+
+        Returns:
+            int: 写入的记录数
+        """
+        count = await self.preference_repository.upsert_many(
+            user_id, tool_type, enabled_map
+        )
+        logger.info(
+            f"User {user_id} set enabled state for "
+            f"{len(enabled_map)} {tool_type.value} tools"
+        )
+        return count
+
     async def delete_tool_preferences(
         self,
         tool_type: ToolType,
@@ -142,6 +142,10 @@ class Sandbox(Protocol):
         """只读属性，返回沙箱Shell WebSocket基础链接"""
         ...
 
+    def get_shell_ws_target_url(self, session_id: str) -> str:
+        """根据传递的shell会话id获取完整的Shell WebSocket透传链接"""
+        ...
+
     @property
     def vnc_url(self) -> str:
         """只读属性，获取沙箱的vnc链接(远程桌面链接)"""
@@ -9,6 +9,8 @@ from app.domain.models.user_tool_preference import ToolType, UserToolPreference
 class UserToolPreferenceRepository(ABC):
     """用户工具偏好仓储抽象接口"""
 
+    __slots__ = ()
+
     @abstractmethod
     async def create(self, preference: UserToolPreference) -> UserToolPreference:
         """创建用户工具偏好"""
@@ -38,6 +40,13 @@ class UserToolPreferenceRepository(ABC):
         """创建或更新用户工具偏好"""
         pass
 
+    @abstractmethod
+    async def upsert_many(
+        self, user_id: str, tool_type: ToolType, enabled_map: dict[str, bool]
+    ) -> int:
+        """批量创建或更新同一用户同一类型的工具偏好"""
+        pass
+
     @abstractmethod
     async def delete(self, preference_id: str) -> bool:
         """删除用户工具偏好"""
@@ -6,6 +6,7 @@ import time
 import uuid
 from pathlib import Path
 from typing import BinaryIO, Optional, Self
+from urllib.parse import quote
 
 import docker
 import httpx
@@ -33,6 +34,7 @@ class DockerSandbox(Sandbox):
         self._container_name = container_name
         self._base_url = f"http://{ip}:8080"
         self._shell_ws_url = f"ws://{ip}:8080/api/shell/ws"
+        self._shell_ws_target_urls: dict[str, str] = {}
         self._vnc_url = f"ws://{ip}:5901"
         self._cdp_url = f"http://{ip}:9222"
 
@@ -55,6 +57,14 @@ class DockerSandbox(Sandbox):
     def shell_ws_url(self) -> str:
         return self._shell_ws_url
 
+    def get_shell_ws_target_url(self, session_id: str) -> str:
+        """获取指定shell会话的WebSocket透传链接，首次计算后缓存，重连时直接复用"""
+        target_url = self._shell_ws_target_urls.get(session_id)
+        if target_url is None:
+            target_url = f"{self._shell_ws_url}?session_id={quote(session_id, safe='')}"
+            self._shell_ws_target_urls[session_id] = target_url
+        return target_url
+
     @classmethod
     @alru_cache(maxsize=128, typed=True)
     async def _resolve_hostname_to_ip(cls, hostname: str) -> Optional[str]:
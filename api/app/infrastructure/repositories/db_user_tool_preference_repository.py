@@ -1,5 +1,7 @@
 """用户工具偏好仓储实现"""
 
+import uuid
+from datetime import datetime
 from typing import Optional
 
 from app.domain.models.user_tool_preference import ToolType, UserToolPreference
@@ -8,12 +10,15 @@ from app.domain.repositories.user_tool_preference_repository import (
 )
 from app.infrastructure.models.user_tool_preference import UserToolPreferenceModel
 from sqlalchemy import and_, delete, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class DBUserToolPreferenceRepository(UserToolPreferenceRepository):
     """基于数据库的用户工具偏好仓储实现"""
 
+    __slots__ = ("db_session",)
+
     def __init__(self, db_session: AsyncSession) -> None:
         """构造函数，完成数据仓储初始化"""
         self.db_session = db_session
@@ -90,6 +95,33 @@ class DBUserToolPreferenceRepository(UserToolPreferenceRepository):
             # 创建
             return await self.create(preference)
 
+    async def upsert_many(
+        self, user_id: str, tool_type: ToolType, enabled_map: dict[str, bool]
+    ) -> int:
+        """批量创建或更新用户工具偏好，单条 INSERT ... ON CONFLICT 完成"""
+        if not enabled_map:
+            return 0
+        now = datetime.now()
+        stmt = insert(UserToolPreferenceModel).values(
+            [
+                {
+                    "id": str(uuid.uuid4()),
+                    "user_id": user_id,
+                    "tool_type": tool_type.value,
+                    "tool_id": tool_id,
+                    "enabled": enabled,
+                    "updated_at": now,
+                }
+                for tool_id, enabled in enabled_map.items()
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_user_tool_preferences_user_tool",
+            set_={"enabled": stmt.excluded.enabled, "updated_at": now},
+        )
+        result = await self.db_session.execute(stmt)
+        return result.rowcount
+
     async def delete(self, preference_id: str) -> bool:
         """删除用户工具偏好"""
         stmt = select(UserToolPreferenceModel).where(
@@ -81,7 +81,9 @@ class MinioStore:
         data: BinaryIO,
         length: int,
         content_type: str | None = None,
+        part_size: int = 0,
     ) -> dict[str, Any]:
+        """上传文件对象，length=-1 时按 part_size 分片流式上传"""
         client = self.client
         result = await self._run_sync(
             client.put_object,
@@ -90,6 +92,32 @@ class MinioStore:
             data,
             length,
             content_type=content_type or "application/octet-stream",
+            part_size=part_size,
+        )
+        return {
+            "bucket": bucket_name,
+            "object": object_name,
+            "etag": getattr(result, "etag", None),
+            "version_id": getattr(result, "version_id", None),
+        }
+
+    async def upload_file(
+        self,
+        bucket_name: str,
+        object_name: str,
+        file_path: str,
+        content_type: str | None = None,
+        part_size: int = 0,
+    ) -> dict[str, Any]:
+        """按本地路径上传文件，由SDK自行打开文件并按 part_size 分片读取上传"""
+        client = self.client
+        result = await self._run_sync(
+            client.fput_object,
+            bucket_name,
+            object_name,
+            file_path,
+            content_type=content_type or "application/octet-stream",
+            part_size=part_size,
         )
         return {
             "bucket": bucket_name,
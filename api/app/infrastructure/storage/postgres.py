@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import NullPool
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +86,15 @@ class Postgres:
         return self._session_factory
 
 
+def create_ephemeral_engine() -> AsyncEngine:
+    """创建一次性脚本使用的数据库引擎，不保留连接池，用完需调用dispose"""
+    return create_async_engine(
+        get_settings().sqlalchemy_database_url,
+        echo=False,
+        poolclass=NullPool,
+    )
+
+
 @lru_cache()
 def get_postgres() -> Postgres:
     """获取获取Postgres实例"""
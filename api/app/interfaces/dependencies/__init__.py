@@ -16,6 +16,7 @@ from .rate_limit import (
     RateLimitBucket,
     RateLimitChannel,
     acquire_connection_limit,
+    acquire_limited_connection,
     enforce_request_limit,
     rate_limit_chat,
     rate_limit_read,
@@ -37,6 +38,7 @@ __all__ = [
     "RateLimitChannel",
     "enforce_request_limit",
     "acquire_connection_limit",
+    "acquire_limited_connection",
     "rate_limit_read",
     "rate_limit_write",
     "rate_limit_chat",
@@ -5,6 +5,7 @@ import time
 import uuid
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 from app.application.errors.exceptions import ServiceUnavailableError, TooManyRequestsError
 from app.domain.models.user import User
@@ -12,6 +13,7 @@ from app.infrastructure.storage.redis import RedisClient, get_redis
 from core.config import get_settings
 from fastapi import Depends
 from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
 
 from .auth import CurrentUser
 
@@ -171,6 +173,106 @@ async def acquire_connection_limit(
         raise ServiceUnavailableError("限流服务不可用，请稍后重试")
 
 
+# 请求限流 + 连接并发限制合并脚本，一次Redis往返完成两项检查与连接登记
+# 返回 {0, ""} 表示成功；{1, ttl} 表示请求超限；{2, 最早连接时间戳} 表示并发超限
+# 注意：脚本同时访问请求计数与连接集合两个key，二者没有共同的hash tag，
+# 在Redis Cluster下会因CROSSSLOT报错，目前仅支持单实例/主从部署
+_CONNECT_LIMIT_SCRIPT = """
+local current = redis.call("INCR", KEYS[1])
+if current == 1 then
+    redis.call("EXPIRE", KEYS[1], tonumber(ARGV[2]) + 1)
+end
+if current > tonumber(ARGV[1]) then
+    return {1, redis.call("TTL", KEYS[1])}
+end
+local now = tonumber(ARGV[3])
+local ttl = tonumber(ARGV[4])
+redis.call("ZREMRANGEBYSCORE", KEYS[2], 0, now - ttl)
+if redis.call("ZCARD", KEYS[2]) >= tonumber(ARGV[5]) then
+    local oldest = redis.call("ZRANGE", KEYS[2], 0, 0, "WITHSCORES")
+    return {2, oldest[2] or ""}
+end
+redis.call("ZADD", KEYS[2], now, ARGV[6])
+redis.call("EXPIRE", KEYS[2], ttl)
+return {0, ""}
+"""
+
+
+@lru_cache(maxsize=1)
+def _get_connect_limit_script(redis: Redis) -> AsyncScript:
+    """按Redis客户端缓存已注册的合并限流脚本，避免每次建连都重新构建Script对象"""
+    return redis.register_script(_CONNECT_LIMIT_SCRIPT)
+
+
+async def acquire_limited_connection(
+    bucket: RateLimitBucket,
+    channel: RateLimitChannel,
+    current_user: User,
+    redis_client: RedisClient,
+) -> ConnectionLease:
+    """请求级限流 + 连接并发限制，通过Lua脚本在一次Redis往返内原子完成"""
+    settings = get_settings()
+    request_limit = _get_limit(bucket)
+    window_seconds = settings.rate_limit_window_seconds
+    window = int(time.time() // window_seconds)
+    request_key = f"rl:req:{bucket.value}:{current_user.id}:{window}"
+
+    connection_limit = _get_connection_limit(channel)
+    ttl_seconds = settings.rate_limit_connection_ttl_seconds
+    heartbeat_seconds = settings.rate_limit_heartbeat_seconds
+    connection_key = f"rl:conn:{channel.value}:{current_user.id}"
+    member = str(uuid.uuid4())
+    now = time.time()
+    redis = redis_client.client
+
+    try:
+        script = _get_connect_limit_script(redis)
+        status, detail = await script(
+            keys=[request_key, connection_key],
+            args=[
+                request_limit,
+                window_seconds,
+                now,
+                ttl_seconds,
+                connection_limit,
+                member,
+            ],
+        )
+        status = int(status)
+        if status == 1:
+            ttl = int(detail)
+            raise TooManyRequestsError(
+                retry_after=ttl if ttl > 0 else window_seconds,
+                limit=request_limit,
+                window_seconds=window_seconds,
+                bucket=bucket.value,
+            )
+        if status == 2:
+            retry_after = heartbeat_seconds
+            if detail not in (None, ""):
+                retry_after = max(1, math.ceil(float(detail) + ttl_seconds - now))
+            raise TooManyRequestsError(
+                retry_after=retry_after,
+                limit=connection_limit,
+                window_seconds=ttl_seconds,
+                bucket=channel.value,
+                msg="并发连接数已达上限，请稍后重试",
+            )
+
+        return ConnectionLease(
+            redis=redis,
+            key=connection_key,
+            member=member,
+            heartbeat_seconds=heartbeat_seconds,
+            ttl_seconds=ttl_seconds,
+        )
+    except TooManyRequestsError:
+        raise
+    except Exception as exc:
+        logger.error(f"连接限流失败: {exc}")
+        raise ServiceUnavailableError("限流服务不可用，请稍后重试")
+
+
 async def rate_limit_read(
     current_user: CurrentUser,
     redis_client: RedisClient = Depends(get_redis),
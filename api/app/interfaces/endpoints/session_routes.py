@@ -1,12 +1,18 @@
 import asyncio
 import json
 import logging
+import random
+import socket
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import AsyncGenerator, Dict, Optional
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional
 from urllib.parse import quote
 
+import orjson
 import websockets
 from app.application.errors.exceptions import (
+    AppException,
     BadRequestError,
     ConflictError,
     ForbiddenError,
@@ -16,20 +22,27 @@ from app.application.errors.exceptions import (
 )
 from app.application.services.agent_service import AgentService
 from app.application.services.session_service import SessionService
+from app.domain.models.session import Session
 from app.interfaces.dependencies import (
     CurrentUser,
     RateLimitBucket,
     RateLimitChannel,
     acquire_connection_limit,
-    enforce_request_limit,
+    acquire_limited_connection,
     get_current_user_ws_query,
     rate_limit_chat,
     rate_limit_read,
     rate_limit_write,
 )
-from app.interfaces.schemas import Response
-from app.interfaces.schemas.event import EventMapper
+from app.interfaces.schemas import Response, success_json_response
+from app.interfaces.schemas.event import (
+    AgentSSEEvent,
+    EventMapper,
+    encode_sse,
+    encode_sse_event_json,
+)
 from app.interfaces.schemas.session import (
+    BatchSessionRequest,
     ChatRequest,
     CreateSessionResponse,
     EndTakeoverRequest,
@@ -55,20 +68,203 @@ from app.interfaces.service_dependencies import get_agent_service, get_session_s
 from app.infrastructure.storage.redis import RedisClient, get_redis
 from core.config import get_settings
 from fastapi import APIRouter, Depends, Response as FastAPIResponse
+from fastapi.responses import ORJSONResponse
 from sse_starlette import EventSourceResponse, ServerSentEvent
 from starlette.websockets import WebSocket, WebSocketDisconnect
 from websockets import ConnectionClosed
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/sessions", tags=["会话模块"])
+router = APIRouter(
+    prefix="/sessions", tags=["会话模块"], default_response_class=ORJSONResponse
+)
 
 # 流式获取会话详情睡眠间隔
 SESSION_SLEEP_INTERVAL = 5
+# 睡眠间隔的随机抖动幅度(秒)，打散同一时刻建立的SSE连接，避免集中查询数据库
+SESSION_SLEEP_JITTER = 0.5
 SSE_HEADERS = {
     "Cache-Control": "no-cache",
     "Connection": "keep-alive",
     "X-Accel-Buffering": "no",
 }
+# 会话详情SSE事件缓存容量，缓存内容为
+# 会话id -> (已转换事件数, 最后一个事件id, 预编码的事件JSON片段列表, 片段总字节数)
+SESSION_EVENTS_CACHE_SIZE = 256
+# 缓存片段的总字节上限，以及单个会话可缓存的最大字节数(超出则不缓存)
+SESSION_EVENTS_CACHE_MAX_BYTES = 64 * 1024 * 1024
+SESSION_EVENTS_CACHE_ENTRY_MAX_BYTES = 8 * 1024 * 1024
+_session_events_cache: OrderedDict[
+    str, tuple[int, Optional[str], List[orjson.Fragment], int]
+] = OrderedDict()
+_session_events_cache_bytes = 0
+# 会话列表合并查询缓存有效期(秒)，同一用户的多个SSE连接在有效期内共享同一次数据库查询
+SESSION_LIST_CACHE_TTL = 2.0
+_session_list_cache: dict[
+    tuple[Optional[str], bool], tuple[float, asyncio.Task[List[Session]]]
+] = {}
+# 接管终端 沙箱->客户端 转发队列上限，终端输出积压超过上限时以1013关闭连接，避免内存无限增长
+TAKEOVER_OUTBOUND_QUEUE_MAXSIZE = 256
+# 接管终端关闭时等待发送队列中剩余数据的最长时间(秒)
+TAKEOVER_OUTBOUND_FLUSH_TIMEOUT = 2.0
+# VNC 双向转发队列上限，以及单次合并发送的最大字节数
+VNC_FORWARD_QUEUE_MAXSIZE = 64
+VNC_FORWARD_BATCH_BYTES = 64 * 1024
+# noVNC 支持的子协议，按优先级排列
+VNC_PREFERRED_SUBPROTOCOLS = ("binary", "base64")
+# 连接沙箱VNC的WebSocket参数：VNC帧已是编码后的二进制数据，关闭permessage-deflate压缩；
+# 单条消息上限放宽到16MiB以容纳大尺寸帧缓冲更新，同时保留内存上界
+VNC_UPSTREAM_MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+VNC_UPSTREAM_CONNECT_OPTIONS: dict[str, Any] = {
+    "compression": None,
+    "max_size": VNC_UPSTREAM_MAX_MESSAGE_BYTES,
+}
+
+
+def _encode_sse_event_fragments(
+    sse_events: List[AgentSSEEvent],
+) -> tuple[List[orjson.Fragment], int]:
+    """将SSE事件逐个预编码为JSON片段，响应时由orjson直接拼接，同时返回片段总字节数"""
+    encoded = [encode_sse_event_json(event) for event in sse_events]
+    return [orjson.Fragment(data) for data in encoded], sum(map(len, encoded))
+
+
+def _evict_session_events_cache(session_id: str) -> None:
+    """移除指定会话的事件片段缓存，并同步扣减缓存总字节数"""
+    global _session_events_cache_bytes
+    cached = _session_events_cache.pop(session_id, None)
+    if cached is not None:
+        _session_events_cache_bytes -= cached[3]
+
+
+def _get_cached_session_event_fragments(session: Session) -> List[orjson.Fragment]:
+    """获取会话事件的JSON片段，会话事件只追加不修改，命中缓存时仅转换新增的尾部事件"""
+    global _session_events_cache_bytes
+    events = session.events
+    cached = _session_events_cache.get(session.id)
+    if (
+        cached
+        and cached[0] <= len(events)
+        and (cached[0] == 0 or events[cached[0] - 1].id == cached[1])
+    ):
+        cached_count, _, fragments, size = cached
+        if cached_count < len(events):
+            new_fragments, new_size = _encode_sse_event_fragments(
+                EventMapper.events_to_sse_events(events[cached_count:])
+            )
+            fragments = fragments + new_fragments
+            size += new_size
+    else:
+        fragments, size = _encode_sse_event_fragments(
+            EventMapper.events_to_sse_events(events)
+        )
+
+    # 先移除旧条目再按字节上限决定是否缓存，超大会话每次直接编码，不挤占缓存
+    _evict_session_events_cache(session.id)
+    if size > SESSION_EVENTS_CACHE_ENTRY_MAX_BYTES:
+        return fragments
+
+    _session_events_cache[session.id] = (
+        len(events),
+        events[-1].id if events else None,
+        fragments,
+        size,
+    )
+    _session_events_cache_bytes += size
+    while (
+        len(_session_events_cache) > SESSION_EVENTS_CACHE_SIZE
+        or _session_events_cache_bytes > SESSION_EVENTS_CACHE_MAX_BYTES
+    ):
+        _, evicted = _session_events_cache.popitem(last=False)
+        _session_events_cache_bytes -= evicted[3]
+    return fragments
+
+
+def _build_session_items(sessions: List[Session]) -> List[ListSessionItem]:
+    """将会话领域模型组装为列表条目，数据来自数据库可信来源，跳过Pydantic校验"""
+    return [
+        ListSessionItem.model_construct(
+            session_id=session.id,
+            title=session.title,
+            latest_message=session.latest_message,
+            latest_message_at=session.latest_message_at,
+            status=session.status,
+            unread_message_count=session.unread_message_count,
+        )
+        for session in sessions
+    ]
+
+
+async def _get_all_sessions_coalesced(
+    session_service: SessionService, user_id: str, is_admin: bool
+) -> List[Session]:
+    """获取会话列表，短时间内相同查询(含进行中的查询)直接复用同一个查询任务的结果"""
+    loop = asyncio.get_running_loop()
+    now = time.monotonic()
+    # 管理员看到的是全部会话，与具体用户无关，所有管理员共享同一个缓存键
+    key = (None if is_admin else user_id, is_admin)
+
+    cached = _session_list_cache.get(key)
+    if (
+        cached
+        and now - cached[0] < SESSION_LIST_CACHE_TTL
+        and cached[1].get_loop() is loop
+    ):
+        task = cached[1]
+    else:
+        # 清理已过期的缓存条目，避免缓存随用户数无限增长
+        for expired_key in [
+            k
+            for k, (created_at, _) in _session_list_cache.items()
+            if now - created_at >= SESSION_LIST_CACHE_TTL
+        ]:
+            del _session_list_cache[expired_key]
+
+        task = loop.create_task(session_service.get_all_sessions(user_id, is_admin))
+        _session_list_cache[key] = (now, task)
+
+    try:
+        # 使用shield避免某个SSE连接断开时取消其他连接共享的查询任务
+        return await asyncio.shield(task)
+    except Exception:
+        # 查询失败的结果不缓存，下一次调用重新查询
+        if _session_list_cache.get(key, (0.0, None))[1] is task:
+            del _session_list_cache[key]
+        raise
+
+
+def _sessions_snapshot(sessions: List[Session]) -> tuple:
+    """提取会话列表中参与推送的字段，用于判断会话列表是否发生变化"""
+    return tuple(
+        (
+            session.id,
+            session.title,
+            session.latest_message,
+            session.latest_message_at,
+            session.status,
+            session.unread_message_count,
+        )
+        for session in sessions
+    )
+
+
+def _dump_sessions_payload(sessions: List[Session]) -> str:
+    """直接将会话列表序列化为ListSessionResponse结构的JSON字符串，不经过Pydantic模型"""
+    return orjson.dumps(
+        {
+            "sessions": [
+                {
+                    "session_id": session.id,
+                    "title": session.title,
+                    "latest_message": session.latest_message,
+                    "latest_message_at": session.latest_message_at,
+                    "status": session.status,
+                    "unread_message_count": session.unread_message_count,
+                }
+                for session in sessions
+            ]
+        },
+        option=orjson.OPT_UTC_Z,
+    ).decode()
 
 
 @router.post(
@@ -101,6 +297,7 @@ async def stream_sessions(
     redis_client: RedisClient = Depends(get_redis),
 ) -> EventSourceResponse:
     """间隔指定时间流式获取所有会话基础信息列表"""
+    is_admin = current_user.is_admin()
     lease = await acquire_connection_limit(
         channel=RateLimitChannel.SSE,
         user_id=current_user.id,
@@ -110,34 +307,29 @@ async def stream_sessions(
 
     async def event_generator() -> AsyncGenerator[ServerSentEvent, None]:
         """定义一个异步迭代器，用于获取所有会话列表"""
+        previous_snapshot = None
         try:
             while True:
                 # 1.获取所有会话列表
-                sessions = await session_service.get_all_sessions(
-                    current_user.id, current_user.is_admin()
+                sessions = await _get_all_sessions_coalesced(
+                    session_service, current_user.id, is_admin
                 )
 
-                # 2.循环遍历并组装数据
-                session_items = [
-                    ListSessionItem(
-                        session_id=session.id,
-                        title=session.title,
-                        latest_message=session.latest_message,
-                        latest_message_at=session.latest_message_at,
-                        status=session.status,
-                        unread_message_count=session.unread_message_count,
+                # 2.会话列表与上次推送一致时跳过序列化与推送(连接保活由SSE ping负责)
+                snapshot = _sessions_snapshot(sessions)
+                if snapshot != previous_snapshot:
+                    previous_snapshot = snapshot
+                    # 3.将会话列表直接序列化为流式事件数据并返回
+                    yield ServerSentEvent(
+                        event="sessions",
+                        data=_dump_sessions_payload(sessions),
                     )
-                    for session in sessions
-                ]
-
-                # 3.将会话列表转换为流式事件数据并返回
-                yield ServerSentEvent(
-                    event="sessions",
-                    data=ListSessionResponse(sessions=session_items).model_dump_json(),
-                )
 
                 # 4.睡眠指定时间避免高频响应
-                await asyncio.sleep(SESSION_SLEEP_INTERVAL)
+                await asyncio.sleep(
+                    SESSION_SLEEP_INTERVAL
+                    + random.uniform(-SESSION_SLEEP_JITTER, SESSION_SLEEP_JITTER)
+                )
         finally:
             await lease.release()
 
@@ -159,19 +351,11 @@ async def get_all_sessions(
     sessions = await session_service.get_all_sessions(
         current_user.id, current_user.is_admin()
     )
-    session_items = [
-        ListSessionItem(
-            session_id=session.id,
-            title=session.title,
-            latest_message=session.latest_message,
-            latest_message_at=session.latest_message_at,
-            status=session.status,
-            unread_message_count=session.unread_message_count,
-        )
-        for session in sessions
-    ]
     return Response.success(
-        msg="获取任务会话列表成功", data=ListSessionResponse(sessions=session_items)
+        msg="获取任务会话列表成功",
+        data=ListSessionResponse.model_construct(
+            sessions=_build_session_items(sessions)
+        ),
     )
 
 
@@ -214,9 +398,83 @@ async def delete_session(
         user_id=current_user.id,
         is_admin=current_user.is_admin(),
     )
+    _evict_session_events_cache(session_id)
     return Response.success(msg="删除任务会话成功")
 
 
+@router.post(
+    path="/batch",
+    response_model=Response[Optional[Dict]],
+    summary="批量操作任务会话",
+    description="对当前用户的多个任务会话批量执行清除未读消息数/删除/停止操作",
+    dependencies=[Depends(rate_limit_write)],
+)
+async def batch_sessions(
+    request: BatchSessionRequest,
+    current_user: CurrentUser,
+    session_service: SessionService = Depends(get_session_service),
+    agent_service: AgentService = Depends(get_agent_service),
+) -> Response[Optional[Dict]]:
+    """根据传递的操作类型+会话id列表批量操作当前用户的任务会话
+
+    删除/停止逐个执行，单个会话失败不会中断其余会话，结果按会话id汇总到succeeded/failed
+    """
+    is_admin = current_user.is_admin()
+    # 1.去重并保持顺序，避免重复操作同一个会话
+    session_ids = list(dict.fromkeys(request.session_ids))
+
+    # 2.清除未读消息数在同一个事务内完成
+    if request.op == "clear":
+        await session_service.clear_unread_message_counts(
+            session_ids=session_ids,
+            user_id=current_user.id,
+            is_admin=is_admin,
+        )
+        return Response.success(
+            data={"succeeded": session_ids, "failed": []},
+            msg="批量清除未读消息数成功",
+        )
+
+    # 3.先校验全部会话均可访问，越权或不存在时整批拒绝，不做任何修改
+    await session_service.check_sessions_access(
+        session_ids=session_ids,
+        user_id=current_user.id,
+        is_admin=is_admin,
+    )
+
+    # 4.删除/停止涉及任务与沙箱清理，服务共享同一个uow，因此逐个顺序执行
+    succeeded: List[str] = []
+    failed: List[Dict[str, str]] = []
+    for session_id in session_ids:
+        try:
+            if request.op == "delete":
+                await session_service.delete_session(
+                    session_id=session_id,
+                    user_id=current_user.id,
+                    is_admin=is_admin,
+                )
+                _evict_session_events_cache(session_id)
+            else:
+                await agent_service.stop_session(
+                    session_id=session_id,
+                    user_id=current_user.id,
+                    is_admin=is_admin,
+                )
+            succeeded.append(session_id)
+        except AppException as e:
+            logger.warning(f"批量操作会话[{session_id}]失败: {e.msg}")
+            failed.append({"session_id": session_id, "msg": e.msg})
+        except Exception as e:
+            logger.exception(f"批量操作会话[{session_id}]出现异常: {str(e)}")
+            failed.append({"session_id": session_id, "msg": "操作失败"})
+
+    op_name = "删除" if request.op == "delete" else "停止"
+    return Response.success(
+        data={"succeeded": succeeded, "failed": failed},
+        msg=f"批量{op_name}任务会话部分失败" if failed else f"批量{op_name}任务会话成功",
+    )
+
+
 @router.post(
     path="/{session_id}/chat",
     summary="向指定任务会话发起聊天请求",
@@ -231,6 +489,7 @@ async def chat(
     redis_client: RedisClient = Depends(get_redis),
 ) -> EventSourceResponse:
     """根据传递的会话id+chat请求数据向指定会话发起聊天请求"""
+    is_admin = current_user.is_admin()
     lease = await acquire_connection_limit(
         channel=RateLimitChannel.SSE,
         user_id=current_user.id,
@@ -238,14 +497,14 @@ async def chat(
     )
     lease.start_heartbeat()
 
-    async def event_generator() -> AsyncGenerator[ServerSentEvent, None]:
+    async def event_generator() -> AsyncGenerator[bytes, None]:
         """定义事件生成器，用于配合EventSourceResponse生成流式响应数据"""
         try:
             # 1.调用Agent服务发起聊天
             async for event in agent_service.chat(
                 session_id=session_id,
                 user_id=current_user.id,
-                is_admin=current_user.is_admin(),
+                is_admin=is_admin,
                 message=request.message,
                 attachments=request.attachments,
                 skill_confirmation_action=request.skill_confirmation_action,
@@ -256,13 +515,11 @@ async def chat(
                     else None
                 ),
             ):
-                # 2.将Agent事件转换为sse数据(因为普通的event没法通过流式事件传输)
+                # 2.将Agent事件转换为sse数据(因为普通的event没法通过流式事件传输)，
+                # 数据为单行JSON，直接编码为SSE帧字节交给EventSourceResponse发送
                 sse_event = EventMapper.event_to_sse_event(event)
                 if sse_event:
-                    yield ServerSentEvent(
-                        event=sse_event.event,
-                        data=sse_event.data.model_dump_json(),
-                    )
+                    yield encode_sse(sse_event)
         finally:
             await lease.release()
 
@@ -289,14 +546,16 @@ async def get_session(
     )
     if not session:
         raise NotFoundError("该会话不存在，请核实后重试")
-    return Response.success(
+    # 事件列表可能很长，直接拼接缓存的预编码JSON片段，跳过响应模型的逐事件序列化
+    fragments = _get_cached_session_event_fragments(session)
+    return success_json_response(
         msg="获取会话详情成功",
-        data=GetSessionResponse(
-            session_id=session.id,
-            title=session.title,
-            status=session.status,
-            events=EventMapper.events_to_sse_events(session.events),
-        ),
+        data={
+            "session_id": session.id,
+            "title": session.title,
+            "status": session.status,
+            "events": fragments,
+        },
     )
 
 
@@ -554,6 +813,18 @@ async def read_shell_output(
     )
 
 
+def _get_shell_ws_target_url(sandbox, shell_session_id: str) -> str:
+    """获取接管终端的沙箱WS透传链接，沙箱不支持WS透传时返回空字符串"""
+    get_target_url = getattr(sandbox, "get_shell_ws_target_url", None)
+    if callable(get_target_url):
+        return get_target_url(shell_session_id)
+
+    sandbox_shell_ws_url = str(getattr(sandbox, "shell_ws_url", "") or "").strip()
+    if not sandbox_shell_ws_url:
+        return ""
+    return f"{sandbox_shell_ws_url}?session_id={quote(shell_session_id, safe='')}"
+
+
 @router.websocket(
     path="/{session_id}/takeover/shell/ws",
 )
@@ -583,29 +854,27 @@ async def takeover_shell_websocket(
 
     try:
         current_user = await get_current_user_ws_query(token)
-        await enforce_request_limit(
+        lease = await acquire_limited_connection(
             bucket=RateLimitBucket.READ,
-            current_user=current_user,
-            redis_client=redis_client,
-        )
-        lease = await acquire_connection_limit(
             channel=RateLimitChannel.WS,
-            user_id=current_user.id,
+            current_user=current_user,
             redis_client=redis_client,
         )
         lease.start_heartbeat()
+        is_admin = current_user.is_admin()
+        user_role = current_user.role.value
         await agent_service.assert_takeover_shell_access(
             session_id=session_id,
             user_id=current_user.id,
             takeover_id=takeover_id,
-            is_admin=current_user.is_admin(),
-            user_role=current_user.role.value,
+            is_admin=is_admin,
+            user_role=user_role,
         )
         sandbox, shell_session_id = await session_service.ensure_takeover_shell_session(
             session_id=session_id,
             takeover_id=takeover_id,
             user_id=current_user.id,
-            is_admin=current_user.is_admin(),
+            is_admin=is_admin,
         )
     except TooManyRequestsError as exc:
         retry_after = (exc.data or {}).get("retry_after", 1)
@@ -646,6 +915,38 @@ async def takeover_shell_websocket(
         closed = asyncio.Event()
         last_output = ""
         last_output_hash = 0
+        # 发送队列，None为结束标记，发送任务读到后退出
+        outbound: asyncio.Queue[bytes | str | None] = asyncio.Queue(
+            maxsize=TAKEOVER_OUTBOUND_QUEUE_MAXSIZE
+        )
+        overflowed = False
+
+        async def enqueue_outbound(data: bytes | str) -> bool:
+            """将待发往客户端的数据放入有界队列，返回False表示客户端消费过慢需断开连接
+
+            文本帧(状态/错误等控制消息)队列满时阻塞等待，从不丢弃；
+            终端输出队列满时不丢弃任何数据，而是标记溢出，由调用方结束转发
+            """
+            nonlocal overflowed
+            if isinstance(data, str):
+                await outbound.put(data)
+                return True
+            try:
+                outbound.put_nowait(data)
+            except asyncio.QueueFull:
+                overflowed = True
+                return False
+            return True
+
+        async def drain_outbound() -> None:
+            while True:
+                data = await outbound.get()
+                if data is None:
+                    break
+                if isinstance(data, bytes):
+                    await websocket.send_bytes(data)
+                else:
+                    await websocket.send_text(data)
 
         async def check_takeover_lease() -> bool:
             try:
@@ -653,8 +954,8 @@ async def takeover_shell_websocket(
                     session_id=session_id,
                     user_id=current_user.id,
                     takeover_id=takeover_id,
-                    is_admin=current_user.is_admin(),
-                    user_role=current_user.role.value,
+                    is_admin=is_admin,
+                    user_role=user_role,
                 )
                 return True
             except ConflictError:
@@ -682,11 +983,8 @@ async def takeover_shell_websocket(
                     break
                 await asyncio.sleep(guard_interval)
 
-        sandbox_shell_ws_url = str(getattr(sandbox, "shell_ws_url", "") or "").strip()
-        if sandbox_shell_ws_url:
-            target_url = (
-                f"{sandbox_shell_ws_url}?session_id={quote(shell_session_id, safe='')}"
-            )
+        target_url = _get_shell_ws_target_url(sandbox, shell_session_id)
+        if target_url:
             logger.info("接管终端走沙箱WS透传: %s", target_url)
 
             async with websockets.connect(target_url) as sandbox_ws:
@@ -715,14 +1013,16 @@ async def takeover_shell_websocket(
                             data = await sandbox_ws.recv()
                         except ConnectionClosed:
                             break
-                        if isinstance(data, bytes):
-                            await websocket.send_bytes(data)
-                        else:
-                            await websocket.send_text(str(data))
+                        if not await enqueue_outbound(
+                            data if isinstance(data, bytes) else str(data)
+                        ):
+                            break
 
+                drain_task = asyncio.create_task(drain_outbound())
                 tasks = [
                     asyncio.create_task(forward_to_sandbox()),
                     asyncio.create_task(forward_from_sandbox()),
+                    drain_task,
                     asyncio.create_task(lease_guard()),
                 ]
                 done, pending = await asyncio.wait(
@@ -813,7 +1113,7 @@ async def takeover_shell_websocket(
                         session_id=shell_session_id, console=False
                     )
                     if not read_result.success:
-                        await websocket.send_text(
+                        await enqueue_outbound(
                             json.dumps(
                                 {
                                     "type": "error",
@@ -844,15 +1144,17 @@ async def takeover_shell_websocket(
                         # 缓冲区被截断/重置/内容不连续 → 全量重传
                         delta = latest_output
 
-                    if delta:
-                        await websocket.send_bytes(delta.encode("utf-8"))
+                    if delta and not await enqueue_outbound(delta.encode("utf-8")):
+                        break
                     last_output = latest_output
                     last_output_hash = latest_hash
                     await asyncio.sleep(0.2)
 
+            drain_task = asyncio.create_task(drain_outbound())
             tasks = [
                 asyncio.create_task(forward_to_sandbox_via_http()),
                 asyncio.create_task(forward_from_sandbox_via_http()),
+                drain_task,
                 asyncio.create_task(lease_guard()),
             ]
             done, pending = await asyncio.wait(
@@ -861,13 +1163,32 @@ async def takeover_shell_websocket(
             )
 
         closed.set()
+        # 先停止除发送任务外的其余任务，再把队列中剩余数据发完后结束发送任务
         for task in pending:
-            task.cancel()
-        for task in pending:
+            if task is not drain_task:
+                task.cancel()
+        await asyncio.gather(
+            *(task for task in pending if task is not drain_task),
+            return_exceptions=True,
+        )
+        if not drain_task.done() and not overflowed:
+
+            async def flush_outbound() -> None:
+                await outbound.put(None)
+                await drain_task
+
             try:
-                await task
-            except (asyncio.CancelledError, Exception):  # noqa: BLE001
-                pass
+                await asyncio.wait_for(
+                    flush_outbound(), timeout=TAKEOVER_OUTBOUND_FLUSH_TIMEOUT
+                )
+            except Exception as flush_exc:  # noqa: BLE001 - 刷新失败不影响收尾
+                logger.warning(
+                    "接管终端剩余输出发送失败: session_id=%s error=%s",
+                    session_id,
+                    flush_exc,
+                )
+        drain_task.cancel()
+        await asyncio.gather(drain_task, return_exceptions=True)
         for task in done:
             if task.cancelled():
                 continue
@@ -877,25 +1198,86 @@ async def takeover_shell_websocket(
                 logger.warning(
                     "接管终端任务收尾异常: session_id=%s error=%s",
                     session_id,
-                    str(task_exc),
+                    task_exc,
                 )
                 continue
             if exc:
                 logger.warning(
                     "接管终端任务异常退出: session_id=%s error=%s",
                     session_id,
-                    str(exc),
+                    exc,
                 )
+        if overflowed:
+            logger.warning(
+                "接管终端客户端消费过慢，输出积压超过上限，断开连接: session_id=%s",
+                session_id,
+            )
+            await websocket.close(code=1013, reason="客户端消费过慢")
     except WebSocketDisconnect:
         logger.info("接管终端WebSocket连接已断开, session_id=%s", session_id)
     except Exception as exc:
-        logger.error("接管终端WebSocket异常: %s", str(exc))
+        logger.error("接管终端WebSocket异常: %s", exc)
         await websocket.close(code=1011, reason=f"WebSocket异常: {str(exc)}")
     finally:
         if lease:
             await lease.release()
 
 
+def _set_tcp_nodelay(connection: Any) -> None:
+    """显式关闭沙箱侧连接的Nagle算法，VNC输入事件多为小帧，避免被合并延迟发送"""
+    transport = getattr(connection, "transport", None)
+    sock = transport.get_extra_info("socket") if transport is not None else None
+    if sock is None or sock.family not in (socket.AF_INET, socket.AF_INET6):
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except OSError as e:
+        logger.debug("设置TCP_NODELAY失败: %s", e)
+
+
+async def _forward_batched(
+    receive: Callable[[], Awaitable[bytes]],
+    send: Callable[[bytes], Awaitable[Any]],
+) -> None:
+    """经有界队列单向转发数据，发送时将已积压的帧合并为一次send，任一端结束即返回"""
+    queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=VNC_FORWARD_QUEUE_MAXSIZE)
+
+    async def produce() -> None:
+        while True:
+            await queue.put(await receive())
+
+    async def drain() -> None:
+        while True:
+            data = await queue.get()
+            if queue.empty():
+                await send(data)
+                continue
+
+            # VNC(RFB)是字节流协议，积压的多帧可以直接拼接后一次发出
+            batch = [data]
+            total = len(data)
+            while not queue.empty() and total < VNC_FORWARD_BATCH_BYTES:
+                data = queue.get_nowait()
+                batch.append(data)
+                total += len(data)
+            await send(b"".join(batch))
+
+    producer = asyncio.create_task(produce())
+    consumer = asyncio.create_task(drain())
+    try:
+        done, _ = await asyncio.wait(
+            [producer, consumer],
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        for task in done:
+            task.result()
+    finally:
+        producer.cancel()
+        consumer.cancel()
+        # 等待两个任务真正结束，避免任务悬挂及其异常被吞掉
+        await asyncio.gather(producer, consumer, return_exceptions=True)
+
+
 @router.websocket(
     path="/{session_id}/vnc",
 )
@@ -910,14 +1292,10 @@ async def vnc_websocket(
     lease = None
     try:
         current_user = await get_current_user_ws_query(token)
-        await enforce_request_limit(
+        lease = await acquire_limited_connection(
             bucket=RateLimitBucket.READ,
-            current_user=current_user,
-            redis_client=redis_client,
-        )
-        lease = await acquire_connection_limit(
             channel=RateLimitChannel.WS,
-            user_id=current_user.id,
+            current_user=current_user,
             redis_client=redis_client,
         )
         lease.start_heartbeat()
@@ -934,17 +1312,15 @@ async def vnc_websocket(
 
     # 1.从客户端noVNC接收子协议
     protocols_str = websocket.headers.get("sec-websocket-protocol", "")
-    protocols = [p.strip() for p in protocols_str.split(",")]
+    protocols = {p.strip() for p in protocols_str.split(",")}
 
-    # 2.判断使用不同协议(noVNC首选binary)
-    selected_protocol = None
-    if "binary" in protocols:
-        selected_protocol = "binary"
-    elif "base64" in protocols:
-        selected_protocol = "base64"
+    # 2.按优先级选择协议(noVNC首选binary)
+    selected_protocol = next(
+        (p for p in VNC_PREFERRED_SUBPROTOCOLS if p in protocols), None
+    )
 
     # 3.使用对应协议接收websocket连接
-    logger.info(f"为会话[{session_id}]开启WebSocket连接")
+    logger.info("为会话[%s]开启WebSocket连接", session_id)
     await websocket.accept(subprotocol=selected_protocol)
 
     try:
@@ -954,61 +1330,54 @@ async def vnc_websocket(
             user_id=current_user.id,
             is_admin=current_user.is_admin(),
         )
-        logger.info(f"连接WebSocket VNC： {sandbox_vnc_url}")
+        logger.info("连接WebSocket VNC： %s", sandbox_vnc_url)
 
         # 5.创建上下文并连接到vnc
-        async with websockets.connect(sandbox_vnc_url) as sandbox_ws:
+        # 注意：上游连接不做跨客户端复用。RFB是有状态协议，每个noVNC客户端都需要从
+        # 版本协商/认证/ClientInit开始完整握手，复用上一个客户端遗留的连接会让新客户端
+        # 收到错位的帧缓冲数据；沙箱位于内网且为明文ws，新建连接的成本很低
+        async with websockets.connect(
+            sandbox_vnc_url, **VNC_UPSTREAM_CONNECT_OPTIONS
+        ) as sandbox_ws:
+            # 客户端侧连接由uvicorn/asyncio在建立时默认开启TCP_NODELAY，ASGI也不暴露其socket
+            _set_tcp_nodelay(sandbox_ws)
+
             # 6.创建两个异步协程来完成数据的双向转发
             async def forward_to_sandbox():
                 try:
-                    while True:
-                        # 接收来自客户端的数据
-                        data = await websocket.receive_bytes()
-                        await sandbox_ws.send(data)
+                    # 接收来自客户端的数据并批量转发到沙箱
+                    await _forward_batched(websocket.receive_bytes, sandbox_ws.send)
                 except WebSocketDisconnect:
-                    logger.info(f"Web->VNC连接终端")
+                    logger.info("Web->VNC连接终端")
                 except Exception as forward_e:
-                    logger.error(f"forward_to_sandbox出错: {str(forward_e)}")
+                    logger.error("forward_to_sandbox出错: %s", forward_e)
 
             async def forward_from_sandbox():
                 try:
-                    while True:
-                        # 接收来自沙箱的数据并转发
-                        data = await sandbox_ws.recv()
-                        await websocket.send_bytes(data)
+                    # 接收来自沙箱的数据并批量转发到客户端
+                    await _forward_batched(sandbox_ws.recv, websocket.send_bytes)
                 except ConnectionClosed:
                     logger.info("VNC->Web连接关闭")
                 except Exception as forward_e:
-                    logger.error(f"forward_from_sandbox出错: {str(forward_e)}")
-
-            # 7.并行运行两个任务
-            forward_task1 = asyncio.create_task(forward_to_sandbox())
-            forward_task2 = asyncio.create_task(forward_from_sandbox())
-
-            # 8.等待任意任务结束意味WebSocket连接终端
-            done, pending = await asyncio.wait(
-                [forward_task1, forward_task2],
-                return_when=asyncio.FIRST_COMPLETED,
-            )
+                    logger.error("forward_from_sandbox出错: %s", forward_e)
+
+            # 7.在任务组中并行运行两个任务，任一任务结束意味WebSocket连接中断，
+            # 此时直接取消另一个任务(关闭全部链接)，任务组退出时会等待两者收尾
+            async with asyncio.TaskGroup() as task_group:
+                forward_task1 = task_group.create_task(forward_to_sandbox())
+                forward_task2 = task_group.create_task(forward_from_sandbox())
+                forward_task1.add_done_callback(lambda _: forward_task2.cancel())
+                forward_task2.add_done_callback(lambda _: forward_task1.cancel())
             logger.info("WebSocket连接已关闭")
-
-            # 9.如果任一任务完成则取消其他任务(关闭全部链接)
-            for task in pending:
-                task.cancel()
-            for task in pending:
-                try:
-                    await task
-                except (asyncio.CancelledError, Exception):  # noqa: BLE001
-                    pass
     except ConnectionError as connection_e:
         # 连接沙箱环境失败，关闭websocket
-        logger.error(f"连接沙箱环境失败: {str(connection_e)}")
+        logger.error("连接沙箱环境失败: %s", connection_e)
         await websocket.close(
             code=1011, reason=f"连接沙箱环境失败: {str(connection_e)}"
         )
     except Exception as e:
         # 其他错误记录日志并关闭websocket
-        logger.error(f"WebSocket异常: {str(e)}")
+        logger.error("WebSocket异常: %s", e)
         await websocket.close(code=1011, reason=f"WebSocket异常: {str(e)}")
     finally:
         if lease:
@@ -8,13 +8,17 @@ from app.interfaces.dependencies import AdminUser
 from app.interfaces.schemas import Response
 from app.interfaces.schemas.skill import SkillInstallRequest
 from fastapi import APIRouter, Body
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-router = APIRouter(prefix="/app-config/skills", tags=["Skill生态"])
+router = APIRouter(
+    prefix="/app-config/skills",
+    tags=["Skill生态"],
+    default_response_class=ORJSONResponse,
+)
 
 
-def _moved_response(path: str) -> JSONResponse:
-    return JSONResponse(
+def _moved_response(path: str) -> ORJSONResponse:
+    return ORJSONResponse(
         status_code=410,
         content=Response.fail(
             code=410,
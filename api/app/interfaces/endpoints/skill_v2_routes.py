@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import json
-from typing import AsyncGenerator
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Dict
 
 from app.application.services.app_config_service import AppConfigService
 from app.application.services.skill_service import SkillService
 from app.application.services.user_tool_preference_service import UserToolPreferenceService
 from app.domain.models.app_config import SkillRiskPolicy
+from app.domain.models.skill import Skill
 from app.domain.models.skill_creator import SkillCreationResult
 from app.domain.models.user_tool_preference import ToolType
 from app.infrastructure.repositories.db_user_tool_preference_repository import (
@@ -17,14 +20,13 @@ from app.infrastructure.repositories.db_user_tool_preference_repository import (
 from app.infrastructure.repositories.file_skill_repository import FileSkillRepository
 from app.infrastructure.storage.postgres import get_db_session
 from app.interfaces.dependencies import AdminUser, CurrentUser
-from app.interfaces.schemas import Response
+from app.interfaces.schemas import Response, success_json_response
 from app.application.services.skill_export_service import SkillExportService
 from app.interfaces.schemas.skill import (
     BundleFileItem,
     SkillDetailResponse,
     SkillExportFormat,
     SkillInstallRequest,
-    SkillItem,
     SkillListResponse,
     SkillRiskPolicyItem,
     SkillToolItem,
@@ -36,20 +38,48 @@ from app.interfaces.service_dependencies import (
 )
 from core.config import get_settings
 from fastapi import APIRouter, Body, Depends, Query
-from fastapi.responses import Response as FastAPIResponse
+from fastapi.responses import ORJSONResponse, Response as FastAPIResponse
 from pydantic import BaseModel
 from sse_starlette import EventSourceResponse, ServerSentEvent
 from sqlalchemy.ext.asyncio import AsyncSession
 
 settings = get_settings()
-router = APIRouter(prefix="/v2/skills", tags=["Skill生态v2"])
+router = APIRouter(
+    prefix="/v2/skills", tags=["Skill生态v2"], default_response_class=ORJSONResponse
+)
 SSE_HEADERS = {"X-Accel-Buffering": "no"}
+# manifest缺失时的只读空映射，避免每个条目临时分配空字典
+_EMPTY_MANIFEST = MappingProxyType({})
 
 
+@lru_cache(maxsize=1)
 def _build_skill_service() -> SkillService:
+    """Skill服务单例，仓库只持有根目录路径，无请求级状态"""
     return SkillService(FileSkillRepository(settings.skills_root_dir))
 
 
+def _to_skill_item(skill: Skill) -> Dict[str, Any]:
+    """将 Skill 领域对象转换为 SkillItem 结构的字典，数据来自文件系统权威源，不构建模型"""
+    manifest = skill.manifest or _EMPTY_MANIFEST
+    return {
+        "id": skill.id,
+        "slug": skill.slug,
+        "name": skill.name,
+        "description": skill.description,
+        "version": skill.version,
+        "source_type": skill.source_type,
+        "source_ref": skill.source_ref,
+        "runtime_type": skill.runtime_type,
+        "enabled": skill.enabled,
+        "installed_by": skill.installed_by,
+        "created_at": skill.created_at.isoformat(),
+        "updated_at": skill.updated_at.isoformat(),
+        "bundle_file_count": int(manifest.get("bundle_file_count") or 0),
+        "context_ref_count": int(manifest.get("context_ref_count") or 0),
+        "last_sync_at": manifest.get("last_sync_at") or None,
+    }
+
+
 class SkillCreateRequest(BaseModel):
     description: str
 
@@ -62,33 +92,9 @@ class SkillCreateRequest(BaseModel):
 async def list_skills(admin_user: AdminUser) -> Response[SkillListResponse]:
     service = _build_skill_service()
     skills = await service.list_skills()
-    return Response.success(
-        data=SkillListResponse(
-            skills=[
-                SkillItem(
-                    id=skill.id,
-                    slug=skill.slug,
-                    name=skill.name,
-                    description=skill.description,
-                    version=skill.version,
-                    source_type=skill.source_type,
-                    source_ref=skill.source_ref,
-                    runtime_type=skill.runtime_type,
-                    enabled=skill.enabled,
-                    installed_by=skill.installed_by,
-                    created_at=skill.created_at.isoformat(),
-                    updated_at=skill.updated_at.isoformat(),
-                    bundle_file_count=int(
-                        (skill.manifest or {}).get("bundle_file_count") or 0
-                    ),
-                    context_ref_count=int(
-                        (skill.manifest or {}).get("context_ref_count") or 0
-                    ),
-                    last_sync_at=((skill.manifest or {}).get("last_sync_at") or None),
-                )
-                for skill in skills
-            ]
-        )
+    # 列表可能很长，直接以orjson序列化字典，跳过响应模型的逐条目转换与校验
+    return success_json_response(
+        data={"skills": [_to_skill_item(skill) for skill in skills]}
     )
 
 
@@ -175,8 +181,10 @@ async def delete_skill(
     skill_service = _build_skill_service()
     pref_service = UserToolPreferenceService(DBUserToolPreferenceRepository(db_session))
 
-    await skill_service.delete_skill(skill_key)
+    # 先在事务内删除偏好(可回滚)，再执行不可逆的文件系统删除，最后一次性提交；
+    # Skill 不存在或删除失败时由 get_db_session 回滚，偏好数据不会被误删
     await pref_service.delete_tool_preferences(ToolType.SKILL, skill_key)
+    await skill_service.delete_skill(skill_key)
     await db_session.commit()
     return Response.success(msg="Skill 删除成功")
 
@@ -243,7 +251,7 @@ async def get_skill_detail(
     service = _build_skill_service()
     skill = await service.get_skill(skill_key)
 
-    manifest = skill.manifest or {}
+    manifest = skill.manifest or _EMPTY_MANIFEST
     raw_tools = manifest.get("tools") or []
     tools = [
         SkillToolItem(
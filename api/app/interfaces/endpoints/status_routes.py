@@ -4,17 +4,51 @@ from datetime import datetime, timezone
 from typing import List
 from uuid import uuid4
 
+import orjson
 from app.application.services.status_service import StatusService
 from app.domain.models.health_status import HealthStatus
 from app.infrastructure.storage.minio import get_minio
+from app.infrastructure.storage.redis import RedisClient, get_redis
 from app.interfaces.dependencies import AdminUser, CurrentUser
 from app.interfaces.schemas import Response
 from app.interfaces.service_dependencies import get_status_service
 from core.config import get_settings
 from fastapi import APIRouter, Depends, File, UploadFile
+from fastapi import Response as FastAPIResponse
+from fastapi.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/status", tags=["状态模块"])
+settings = get_settings()
+router = APIRouter(
+    prefix="/status", tags=["状态模块"], default_response_class=ORJSONResponse
+)
+_BACKSLASH_TO_SLASH = str.maketrans("\\", "/")
+HEALTH_CHECK_CACHE_KEY = "health:v1"
+
+
+async def _get_cached_statuses(redis_client: RedisClient) -> List[HealthStatus] | None:
+    """读取多实例共享的健康检查缓存，Redis不可用时返回None走实时检查"""
+    try:
+        payload = await redis_client.client.get(HEALTH_CHECK_CACHE_KEY)
+    except Exception as e:
+        logger.warning(f"读取健康检查缓存失败，改为实时检查: {e}")
+        return None
+    if not payload:
+        return None
+    return [HealthStatus(**item) for item in orjson.loads(payload)]
+
+
+async def _set_cached_statuses(
+    redis_client: RedisClient, statues: List[HealthStatus]
+) -> None:
+    try:
+        await redis_client.client.setex(
+            HEALTH_CHECK_CACHE_KEY,
+            settings.health_check_cache_ttl_seconds,
+            orjson.dumps([item.model_dump() for item in statues]),
+        )
+    except Exception as e:
+        logger.warning(f"写入健康检查缓存失败: {e}")
 
 
 @router.get(
@@ -25,12 +59,24 @@ router = APIRouter(prefix="/status", tags=["状态模块"])
 )
 async def get_status(
     current_user: CurrentUser,
+    response: FastAPIResponse,
     status_service: StatusService = Depends(get_status_service),
+    redis_client: RedisClient = Depends(get_redis),
 ) -> Response:
     """系统健康检查，检查postgres/redis/fastapi/minio等服务"""
-    statues = await status_service.check_all()
+    use_cache = settings.health_check_cache_ttl_seconds > 0
+    statues = await _get_cached_statuses(redis_client) if use_cache else None
+    if statues is not None:
+        response.headers["X-Health-Cache"] = "hit"
+        has_error = False
+    else:
+        statues = await status_service.check_all()
+        has_error = any(item.status == "error" for item in statues)
+        # 只缓存健康结果，依赖恢复后下一次请求即可反映真实状态
+        if use_cache and not has_error:
+            await _set_cached_statuses(redis_client, statues)
 
-    if any(item.status == "error" for item in statues):
+    if has_error:
         return Response.fail(503, "系统存在服务异常", statues)
 
     return Response.success(msg="系统健康检查成功", data=statues)
@@ -47,7 +93,6 @@ async def get_minio_status(
     smoke: bool = False,
     bucket: str | None = None,
 ) -> Response:
-    settings = get_settings()
     bucket_name = bucket or settings.minio_bucket_name
     store = get_minio()
 
@@ -80,15 +125,16 @@ async def upload_minio_file(
     presign: bool = True,
     expiry_seconds: int = 3600,
 ) -> Response:
-    settings = get_settings()
     bucket_name = bucket or settings.minio_bucket_name
     store = get_minio()
 
-    normalized_object = (object_name or "").strip().lstrip("/").replace("\\", "/")
+    normalized_object = (
+        (object_name or "").strip().translate(_BACKSLASH_TO_SLASH).lstrip("/")
+    )
     if not normalized_object:
         filename = os.path.basename(file.filename or "upload.bin")
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-        prefix_clean = prefix.strip().strip("/").replace("\\", "/")
+        prefix_clean = prefix.strip().translate(_BACKSLASH_TO_SLASH).strip("/")
         normalized_object = (
             f"{prefix_clean}/{timestamp}-{uuid4().hex}-{filename}"
             if prefix_clean
@@ -103,22 +149,21 @@ async def upload_minio_file(
                 data={"bucket": bucket_name, "object": normalized_object},
             )
 
-        file.file.seek(0, os.SEEK_END)
-        size = file.file.tell()
-        file.file.seek(0)
-
+        # 长度未知时由 MinIO SDK 按分片流式上传，无需预先 seek/tell 探测大小
         data = await store.upload_fileobj(
             bucket_name=bucket_name,
             object_name=normalized_object,
             data=file.file,
-            length=size,
+            length=-1,
             content_type=file.content_type or "application/octet-stream",
+            part_size=settings.minio_upload_part_size,
         )
         data.update(
             {
                 "filename": file.filename,
                 "content_type": file.content_type,
-                "size": size,
+                # 上传后流位置即已读取的总字节数，作为 file.size 缺失时的回退
+                "size": file.size if file.size is not None else file.file.tell(),
             }
         )
         if presign:
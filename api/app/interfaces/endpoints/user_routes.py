@@ -11,16 +11,37 @@ from app.domain.models.user_tool_preference import ToolType
 from app.infrastructure.repositories.db_user_tool_preference_repository import (
     DBUserToolPreferenceRepository,
 )
-from app.infrastructure.storage.postgres import get_postgres
+from app.infrastructure.storage.postgres import get_db_session
 from app.interfaces.dependencies import CurrentUser
 from app.interfaces.schemas import Response
 from app.interfaces.schemas.user import ToolPreferenceRequest, ToolWithPreference
 from app.interfaces.service_dependencies import get_app_config_service
 from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/user/tools", tags=["用户工具偏好"])
+router = APIRouter(
+    prefix="/user/tools", tags=["用户工具偏好"], default_response_class=ORJSONResponse
+)
+
+
+async def _load_disabled_tool_ids(
+    db_session: AsyncSession, user_id: str, tool_type: ToolType, endpoint: str
+) -> frozenset[str]:
+    """查询用户显式禁用的工具 ID 集合（未设置即默认启用），失败时降级为空集合"""
+    pref_service = UserToolPreferenceService(DBUserToolPreferenceRepository(db_session))
+    try:
+        user_prefs = await pref_service.get_user_preferences(user_id, tool_type)
+        return frozenset(pref.tool_id for pref in user_prefs if not pref.enabled)
+    except asyncio.CancelledError:
+        logger.warning(f"{endpoint} 请求被取消，返回上游取消")
+        raise
+    except Exception as e:
+        logger.exception(
+            f"查询用户{tool_type.name}工具偏好失败，降级为默认启用(user_id={user_id}): {e}"
+        )
+        return frozenset()
 
 
 @router.get(
@@ -31,44 +52,30 @@ router = APIRouter(prefix="/user/tools", tags=["用户工具偏好"])
 )
 async def get_mcp_tools(
     current_user: CurrentUser,
+    db_session: AsyncSession = Depends(get_db_session),
     app_config_service: AppConfigService = Depends(get_app_config_service),
 ) -> Response:
     """获取 MCP 工具列表"""
-    # 1. 先查询用户偏好（短暂持有 DB 连接）
-    pref_map: dict[str, bool] = {}
-    postgres = get_postgres()
-    try:
-        async with postgres.session_factory() as session:
-            pref_repo = DBUserToolPreferenceRepository(session)
-            pref_service = UserToolPreferenceService(pref_repo)
-
-            user_prefs = await pref_service.get_user_preferences(
-                current_user.id, ToolType.MCP
-            )
-            pref_map = {pref.tool_id: pref.enabled for pref in user_prefs}
-    except asyncio.CancelledError:
-        logger.warning("get_mcp_tools 请求被取消，返回上游取消")
-        raise
-    except Exception as e:
-        logger.exception(
-            f"查询用户MCP工具偏好失败，降级为默认启用(user_id={current_user.id}): {e}"
-        )
+    # 1. 偏好查询与 MCP 探测相互独立，并发执行（探测不持有 DB 连接）
+    disabled_ids, mcp_servers = await asyncio.gather(
+        _load_disabled_tool_ids(
+            db_session, current_user.id, ToolType.MCP, "get_mcp_tools"
+        ),
+        app_config_service.get_mcp_servers(),
+    )
 
-    # 2. 再做 MCP 探测（不持有 DB 连接，避免取消态影响数据库连接）
-    mcp_servers = await app_config_service.get_mcp_servers()
-
-    # 3. 组装响应
-    tools = []
-    for server in mcp_servers:
-        tools.append(
-            ToolWithPreference(
-                tool_id=server.server_name,
-                tool_name=server.server_name,
-                description=None,  # MCP 服务器可能没有描述字段
-                enabled_global=server.enabled,
-                enabled_user=pref_map.get(server.server_name, True),  # 默认启用
-            )
+    # 2. 组装响应
+    # 字段均来自已校验的配置与偏好记录，跳过 Pydantic 校验
+    tools = [
+        ToolWithPreference.model_construct(
+            tool_id=server.server_name,
+            tool_name=server.server_name,
+            description=None,  # MCP 服务器可能没有描述字段
+            enabled_global=server.enabled,
+            enabled_user=server.server_name not in disabled_ids,  # 默认启用
         )
+        for server in mcp_servers
+    ]
 
     return Response.success(data={"tools": tools})
 
@@ -83,23 +90,21 @@ async def set_mcp_tool_enabled(
     server_name: str,
     request: ToolPreferenceRequest,
     current_user: CurrentUser,
+    db_session: AsyncSession = Depends(get_db_session),
 ) -> Response:
     """设置 MCP 工具个人启用状态"""
-    postgres = get_postgres()
-
-    async with postgres.session_factory() as session:
-        pref_repo = DBUserToolPreferenceRepository(session)
-        pref_service = UserToolPreferenceService(pref_repo)
-
-        await pref_service.set_tool_enabled(
-            current_user.id,
-            ToolType.MCP,
-            server_name,
-            request.enabled,
-        )
-        await session.commit()
+    pref_repo = DBUserToolPreferenceRepository(db_session)
+    pref_service = UserToolPreferenceService(pref_repo)
+
+    await pref_service.set_tool_enabled(
+        current_user.id,
+        ToolType.MCP,
+        server_name,
+        request.enabled,
+    )
+    await db_session.commit()
 
-        return Response.success(msg="设置成功")
+    return Response.success(msg="设置成功")
 
 
 @router.get(
@@ -110,44 +115,30 @@ async def set_mcp_tool_enabled(
 )
 async def get_a2a_tools(
     current_user: CurrentUser,
+    db_session: AsyncSession = Depends(get_db_session),
     app_config_service: AppConfigService = Depends(get_app_config_service),
 ) -> Response:
     """获取 A2A 工具列表"""
-    # 1. 先查询用户偏好（短暂持有 DB 连接）
-    pref_map: dict[str, bool] = {}
-    postgres = get_postgres()
-    try:
-        async with postgres.session_factory() as session:
-            pref_repo = DBUserToolPreferenceRepository(session)
-            pref_service = UserToolPreferenceService(pref_repo)
-
-            user_prefs = await pref_service.get_user_preferences(
-                current_user.id, ToolType.A2A
-            )
-            pref_map = {pref.tool_id: pref.enabled for pref in user_prefs}
-    except asyncio.CancelledError:
-        logger.warning("get_a2a_tools 请求被取消，返回上游取消")
-        raise
-    except Exception as e:
-        logger.exception(
-            f"查询用户A2A工具偏好失败，降级为默认启用(user_id={current_user.id}): {e}"
-        )
+    # 1. 偏好查询与 A2A 探测相互独立，并发执行（探测不持有 DB 连接）
+    disabled_ids, a2a_servers = await asyncio.gather(
+        _load_disabled_tool_ids(
+            db_session, current_user.id, ToolType.A2A, "get_a2a_tools"
+        ),
+        app_config_service.get_a2a_servers(),
+    )
 
-    # 2. 再做 A2A 探测（不持有 DB 连接）
-    a2a_servers = await app_config_service.get_a2a_servers()
-
-    # 3. 组装响应
-    tools = []
-    for server in a2a_servers:
-        tools.append(
-            ToolWithPreference(
-                tool_id=server.id,
-                tool_name=server.name,
-                description=server.description,
-                enabled_global=server.enabled,
-                enabled_user=pref_map.get(server.id, True),  # 默认启用
-            )
+    # 2. 组装响应
+    # 字段均来自已校验的配置与偏好记录，跳过 Pydantic 校验
+    tools = [
+        ToolWithPreference.model_construct(
+            tool_id=server.id,
+            tool_name=server.name,
+            description=server.description,
+            enabled_global=server.enabled,
+            enabled_user=server.id not in disabled_ids,  # 默认启用
         )
+        for server in a2a_servers
+    ]
 
     return Response.success(data={"tools": tools})
 
@@ -162,23 +153,21 @@ async def set_a2a_tool_enabled(
     a2a_id: str,
     request: ToolPreferenceRequest,
     current_user: CurrentUser,
+    db_session: AsyncSession = Depends(get_db_session),
 ) -> Response:
     """设置 A2A 工具个人启用状态"""
-    postgres = get_postgres()
-
-    async with postgres.session_factory() as session:
-        pref_repo = DBUserToolPreferenceRepository(session)
-        pref_service = UserToolPreferenceService(pref_repo)
-
-        await pref_service.set_tool_enabled(
-            current_user.id,
-            ToolType.A2A,
-            a2a_id,
-            request.enabled,
-        )
-        await session.commit()
+    pref_repo = DBUserToolPreferenceRepository(db_session)
+    pref_service = UserToolPreferenceService(pref_repo)
+
+    await pref_service.set_tool_enabled(
+        current_user.id,
+        ToolType.A2A,
+        a2a_id,
+        request.enabled,
+    )
+    await db_session.commit()
 
-        return Response.success(msg="设置成功")
+    return Response.success(msg="设置成功")
 
 
 @router.get(
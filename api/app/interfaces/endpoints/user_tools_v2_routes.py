@@ -2,23 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from app.application.services.skill_service import SkillService
 from app.application.services.user_tool_preference_service import UserToolPreferenceService
 from app.domain.models.user_tool_preference import ToolType
-from app.infrastructure.repositories.db_user_tool_preference_repository import (
-    DBUserToolPreferenceRepository,
-)
 from app.infrastructure.repositories.file_skill_repository import FileSkillRepository
 from app.infrastructure.storage.postgres import get_db_session
 from app.interfaces.dependencies import CurrentUser
 from app.interfaces.schemas import Response
-from app.interfaces.schemas.user import ToolPreferenceRequest, ToolWithPreference
+from app.interfaces.schemas.user import (
+    BatchToolPreferenceRequest,
+    ToolPreferenceRequest,
+    ToolWithPreference,
+)
+from app.interfaces.service_dependencies import get_user_tool_preference_service
 from core.config import get_settings
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 settings = get_settings()
-router = APIRouter(prefix="/v2/user/tools", tags=["用户工具偏好v2"])
+router = APIRouter(
+    prefix="/v2/user/tools",
+    tags=["用户工具偏好v2"],
+    default_response_class=ORJSONResponse,
+)
 
 
 @router.get(
@@ -28,22 +37,27 @@ router = APIRouter(prefix="/v2/user/tools", tags=["用户工具偏好v2"])
 )
 async def get_skill_tools(
     current_user: CurrentUser,
-    db_session: AsyncSession = Depends(get_db_session),
+    pref_service: UserToolPreferenceService = Depends(
+        get_user_tool_preference_service
+    ),
 ) -> Response:
-    pref_service = UserToolPreferenceService(DBUserToolPreferenceRepository(db_session))
     skill_service = SkillService(FileSkillRepository(settings.skills_root_dir))
 
-    user_prefs = await pref_service.get_user_preferences(current_user.id, ToolType.SKILL)
-    pref_map = {pref.tool_id: pref.enabled for pref in user_prefs}
-    skills = await skill_service.list_skills()
+    # 偏好查询(DB)与Skill列表(文件系统)相互独立，并发执行
+    user_prefs, skills = await asyncio.gather(
+        pref_service.get_user_preferences(current_user.id, ToolType.SKILL),
+        skill_service.list_skills(),
+    )
+    # 默认启用，只需记录用户显式禁用的 skill
+    disabled_ids = frozenset(pref.tool_id for pref in user_prefs if not pref.enabled)
 
     tools = [
-        ToolWithPreference(
+        ToolWithPreference.model_construct(
             tool_id=skill.id,
             tool_name=skill.name,
             description=skill.description,
             enabled_global=skill.enabled,
-            enabled_user=pref_map.get(skill.id, True),
+            enabled_user=skill.id not in disabled_ids,
         )
         for skill in skills
     ]
@@ -61,9 +75,10 @@ async def set_skill_tool_enabled(
     request: ToolPreferenceRequest,
     current_user: CurrentUser,
     db_session: AsyncSession = Depends(get_db_session),
+    pref_service: UserToolPreferenceService = Depends(
+        get_user_tool_preference_service
+    ),
 ) -> Response:
-    pref_repo = DBUserToolPreferenceRepository(db_session)
-    pref_service = UserToolPreferenceService(pref_repo)
     await pref_service.set_tool_enabled(
         current_user.id,
         ToolType.SKILL,
@@ -72,3 +87,23 @@ async def set_skill_tool_enabled(
     )
     await db_session.commit()
     return Response.success(msg="设置成功")
+
+
+@router.post(
+    "/skills/batch",
+    response_model=Response,
+    summary="批量设置 Skill 工具个人启用状态（v2）",
+)
+async def set_skill_tools_enabled(
+    request: BatchToolPreferenceRequest,
+    current_user: CurrentUser,
+    db_session: AsyncSession = Depends(get_db_session),
+    pref_service: UserToolPreferenceService = Depends(
+        get_user_tool_preference_service
+    ),
+) -> Response:
+    # 同一 skill 重复出现时以最后一项为准，避免 ON CONFLICT 重复命中同一行
+    enabled_map = {item.tool_id: item.enabled for item in request.items}
+    await pref_service.set_tools_enabled(current_user.id, ToolType.SKILL, enabled_map)
+    await db_session.commit()
+    return Response.success(msg="设置成功")
@@ -3,19 +3,31 @@ import logging
 from app.application.errors.exceptions import AppException, TooManyRequestsError
 from app.interfaces.schemas import Response
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response as FastAPIResponse
 from starlette.exceptions import HTTPException
 
 logger = logging.getLogger(__name__)
 
 
+def _json_response(
+    status_code: int, body: Response, headers: dict[str, str] | None = None
+) -> FastAPIResponse:
+    """直接使用pydantic-core序列化响应体，跳过dict中间态与json.dumps"""
+    return FastAPIResponse(
+        content=body.model_dump_json(),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
+
+
 def register_exception_handlers(app: FastAPI) -> None:
     """处理Actus项目中所有的异常并进行统一处理，涵盖：自定义业务状态异常、HTTP异常、通用异常"""
 
     @app.exception_handler(AppException)
     async def app_exception_handler(
         request: Request, exc: AppException
-    ) -> JSONResponse:
+    ) -> FastAPIResponse:
         """自定义应用异常处理器，捕获AppException并返回标准化响应"""
 
         logger.error(f"App exception: {exc.msg}")
@@ -26,32 +38,32 @@ def register_exception_handlers(app: FastAPI) -> None:
             if retry_after is not None:
                 headers["Retry-After"] = str(retry_after)
 
-        return JSONResponse(
-            status_code=exc.status_code,
-            content=Response(code=exc.code, msg=exc.msg, data=exc.data or {}).model_dump(),
+        return _json_response(
+            exc.status_code,
+            Response(code=exc.code, msg=exc.msg, data=exc.data or {}),
             headers=headers or None,
         )
 
     @app.exception_handler(HTTPException)
     async def http_exception_handler(
         request: Request, exc: HTTPException
-    ) -> JSONResponse:
+    ) -> FastAPIResponse:
         """HTTP异常处理器，捕获HTTPException并返回标准化响应"""
 
         logger.error(f"HTTP exception: {exc.detail}")
 
-        return JSONResponse(
-            status_code=exc.status_code,
-            content=Response(code=exc.status_code, msg=exc.detail, data={}).model_dump(),
+        return _json_response(
+            exc.status_code,
+            Response(code=exc.status_code, msg=exc.detail, data={}),
         )
 
     @app.exception_handler(Exception)
-    async def exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    async def exception_handler(request: Request, exc: Exception) -> FastAPIResponse:
         """通用异常处理器，捕获所有未处理的异常并返回标准化响应, 状态码500"""
         # 这里可以添加日志记录等操作
         logger.error(f"Unhandled exception: {exc}", exc_info=True)
 
-        return JSONResponse(
-            status_code=500,
-            content=Response(code=500, msg="Internal Server Error", data={}).model_dump(),
+        return _json_response(
+            500,
+            Response(code=500, msg="Internal Server Error", data={}),
         )
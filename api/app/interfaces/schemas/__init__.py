@@ -1,3 +1,3 @@
-from .base import Response
+from .base import Response, success_json_response
 
-__all__ = ["Response"]
+__all__ = ["Response", "success_json_response"]
@@ -1,6 +1,8 @@
 from typing import Any, Generic, Optional, TypeVar
 
+import orjson
 from pydantic import BaseModel, Field
+from starlette.responses import Response as StarletteResponse
 
 T = TypeVar("T")
 
@@ -23,6 +25,9 @@ class Response(BaseModel, Generic[T]):
         Returns:
             Response[T]: 表示成功的响应对象。
         """
+        if data is None:
+            # 无数据的成功响应字段均为可信常量，跳过泛型解析与字段校验
+            return Response.model_construct(code=200, msg=msg, data=None)
         return Response[T](code=200, msg=msg, data=data)
 
     @staticmethod
@@ -39,3 +44,11 @@ class Response(BaseModel, Generic[T]):
             Response[Any]: 表示失败的响应对象。
         """
         return Response[Any](code=code, msg=msg, data=data)
+
+
+def success_json_response(data: Any, msg: str = "success") -> StarletteResponse:
+    """成功响应，data为可直接交给orjson的结构，跳过响应模型的转换、校验与序列化"""
+    return StarletteResponse(
+        content=orjson.dumps({"code": 200, "msg": msg, "data": data}),
+        media_type="application/json",
+    )
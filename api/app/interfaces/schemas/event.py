@@ -1,7 +1,18 @@
-from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional, Self, Type, Union, get_args
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Self,
+    Type,
+    Union,
+)
 
+import orjson
 from app.domain.models.event import (
     ControlAction,
     ControlEvent,
@@ -15,33 +26,55 @@ from app.domain.models.event import (
 )
 from app.domain.models.file import File
 from app.domain.models.plan import ExecutionStatus
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    PlainSerializer,
+    Tag,
+)
+
+# 通用事件数据构建时排除的领域事件字段(已由base_event_data单独处理)
+_BASE_EVENT_EXCLUDE_FIELDS = frozenset({"id", "type", "created_at"})
+
+# JSON序列化时输出为秒级时间戳的datetime
+Timestamp = Annotated[
+    datetime,
+    PlainSerializer(lambda v: int(v.timestamp()), return_type=int, when_used="json"),
+]
 
 
 class BaseEventData(BaseModel):
     """基础事件数据"""
 
     event_id: Optional[str] = None  # 事件id
-    created_at: datetime = Field(default_factory=datetime.now)  # 事件时间
+    created_at: Optional[Timestamp] = None  # 事件时间，由base_event_data从领域事件填充
 
-    # pydantic v2写法，序列化时将datetime转换为时间戳
-    model_config = ConfigDict(json_encoders={datetime: lambda v: int(v.timestamp())})
+    # 延迟构建schema，首次使用时再构建
+    model_config = ConfigDict(defer_build=True)
 
     @classmethod
     def base_event_data(cls, event: Event) -> Dict[str, Any]:
-        """类方法，用于将事件Domain模型转换成基础事件数据字典"""
+        """类方法，用于将事件Domain模型转换成基础事件数据字典
+
+        created_at保留datetime，由Timestamp在JSON序列化时转换为时间戳
+        """
         return {
             "event_id": event.id,
-            "created_at": int(event.created_at.timestamp()),
+            "created_at": event.created_at,
         }
 
     @classmethod
     def from_event(cls, event: Event) -> Self:
-        """从事件Domain模型中构建基础事件数据"""
-        return cls(
-            **cls.base_event_data(event),
-            **event.model_dump(mode="json", exclude={"id", "type", "created_at"}),
-        )
+        """从事件Domain模型中构建基础事件数据，数据来自已校验的领域模型，跳过校验"""
+        # 通用路径仅承载title/wait/error/done等标量字段事件，直接读取实例字段，省去一次序列化
+        fields = {
+            key: value
+            for key, value in event.__dict__.items()
+            if key not in _BASE_EVENT_EXCLUDE_FIELDS
+        }
+        return cls.model_construct(**cls.base_event_data(event), **fields)
 
 
 class BaseSSEEvent(BaseModel):
@@ -50,14 +83,17 @@ class BaseSSEEvent(BaseModel):
     event: str  # 事件类型
     data: BaseEventData  # 数据
 
+    # 延迟构建schema，未出现过的事件类型不在导入时付出构建开销
+    model_config = ConfigDict(defer_build=True)
+
     @classmethod
     def from_event(cls, event: Event) -> Self:
         """将事件Domain模型转换成基础流式事件"""
         # 1.获取事件数据的类型，如果没有则使用基础事件数据BaseEventData
         data_class: Type[BaseEventData] = cls.__annotations__.get("data", BaseEventData)
 
-        # 2.调用构造函数完成初始化
-        return cls(
+        # 2.数据来自已校验的领域模型，跳过校验直接构建
+        return cls.model_construct(
             event=event.type,
             data=data_class.from_event(event),
         )
@@ -66,12 +102,7 @@ class BaseSSEEvent(BaseModel):
 class CommonEventData(BaseEventData):
     """通用事件数据，让结构允许填充额外的数据"""
 
-    model_config = ConfigDict(
-        json_encoders={
-            datetime: lambda v: int(v.timestamp()),
-        },
-        extra="allow",
-    )
+    model_config = ConfigDict(extra="allow")
 
 
 class CommonSSEEvent(BaseSSEEvent):
@@ -99,8 +130,8 @@ class MessageSSEEvent(BaseSSEEvent):
 
     @classmethod
     def from_event(cls, event: Event) -> Self:
-        return cls(
-            data=MessageEventData(
+        return cls.model_construct(
+            data=MessageEventData.model_construct(
                 **BaseEventData.base_event_data(event),
                 role=event.role,
                 message=event.message,
@@ -140,8 +171,8 @@ class StepSSEEvent(BaseSSEEvent):
 
     @classmethod
     def from_event(cls, event: StepEvent) -> Self:
-        return cls(
-            data=StepEventData(
+        return cls.model_construct(
+            data=StepEventData.model_construct(
                 **BaseEventData.base_event_data(event),
                 status=event.step.status,
                 id=event.step.id,
@@ -164,12 +195,14 @@ class PlanSSEEvent(BaseSSEEvent):
 
     @classmethod
     def from_event(cls, event: PlanEvent) -> Self:
-        return cls(
-            data=PlanEventData(
-                **BaseEventData.base_event_data(event),
+        # 计划与所有步骤共享同一份基础事件数据，只构建一次
+        base = BaseEventData.base_event_data(event)
+        return cls.model_construct(
+            data=PlanEventData.model_construct(
+                **base,
                 steps=[
-                    StepEventData(
-                        **BaseEventData.base_event_data(event),
+                    StepEventData.model_construct(
+                        **base,
                         id=step.id,
                         status=step.status,
                         description=step.description,
@@ -199,8 +232,8 @@ class ToolSSEEvent(BaseSSEEvent):
 
     @classmethod
     def from_event(cls, event: ToolEvent) -> Self:
-        return cls(
-            data=ToolEventData(
+        return cls.model_construct(
+            data=ToolEventData.model_construct(
                 **BaseEventData.base_event_data(event),
                 tool_call_id=event.tool_call_id,
                 name=event.tool_name,
@@ -249,8 +282,8 @@ class ControlSSEEvent(BaseSSEEvent):
         expires_at = (
             int(event.expires_at.timestamp()) if event.expires_at is not None else None
         )
-        return cls(
-            data=ControlEventData(
+        return cls.model_construct(
+            data=ControlEventData.model_construct(
                 **BaseEventData.base_event_data(event),
                 action=event.action,
                 scope=event.scope,
@@ -277,107 +310,78 @@ class ErrorSSEEvent(BaseSSEEvent):
     data: ErrorEventData
 
 
-# 定义Agent流式事件类型集合
-AgentSSEEvent = Union[
-    CommonSSEEvent,
-    MessageSSEEvent,
-    TitleSSEEvent,
-    StepSSEEvent,
-    PlanSSEEvent,
-    ToolSSEEvent,
-    DoneSSEEvent,
-    ErrorSSEEvent,
-    WaitSSEEvent,
-    ControlSSEEvent,
+def _sse_event_tag(value: Any) -> str:
+    """按event字段直接分派联合类型的变体，未在分派表登记的事件类型回退为通用事件"""
+    event = value.get("event") if isinstance(value, dict) else value.event
+    return event if event in _EVENT_DISPATCH else "common"
+
+
+# 定义Agent流式事件类型集合，通过event标签分派，避免序列化时逐个变体试探
+AgentSSEEvent = Annotated[
+    Union[
+        Annotated[CommonSSEEvent, Tag("common")],
+        Annotated[MessageSSEEvent, Tag("message")],
+        Annotated[TitleSSEEvent, Tag("title")],
+        Annotated[StepSSEEvent, Tag("step")],
+        Annotated[PlanSSEEvent, Tag("plan")],
+        Annotated[ToolSSEEvent, Tag("tool")],
+        Annotated[DoneSSEEvent, Tag("done")],
+        Annotated[ErrorSSEEvent, Tag("error")],
+        Annotated[WaitSSEEvent, Tag("wait")],
+        Annotated[ControlSSEEvent, Tag("control")],
+    ],
+    Discriminator(_sse_event_tag),
 ]
 
 
-@dataclass
-class EventMapping:
-    """事件映射数据类，用于存储事件映射信息，涵盖流式事件类型、数据类、事件类型字符串"""
+# SSE帧事件头前缀缓存(事件名 -> 编码后的前缀)，分隔符与sse_starlette默认的\r\n保持一致
+_SSE_FRAME_PREFIXES: Dict[str, bytes] = {}
 
-    sse_event_class: Type[BaseSSEEvent]
-    data_class: Type[BaseEventData]
-    event_type: str
 
+def encode_sse_event_json(sse_event: BaseSSEEvent) -> bytes:
+    """将流式事件编码为与AgentSSEEvent JSON序列化结果一致的字节"""
+    return orjson.dumps(sse_event.model_dump(mode="json"))
 
-class EventMapper:
-    """事件映射类，利用Python自身提供的自省机制，将业务逻辑中的Event转换成适合流式传输的AgentSSEEvent"""
 
-    # 缓存映射(type: EventMapping)
-    _cache_mapping: Optional[Dict[str, EventMapping]] = None
+def encode_sse(sse_event: BaseSSEEvent) -> bytes:
+    """将流式事件直接编码为SSE帧字节，数据为单行JSON，跳过ServerSentEvent的构造与逐行拆分"""
+    prefix = _SSE_FRAME_PREFIXES.get(sse_event.event)
+    if prefix is None:
+        prefix = f"event: {sse_event.event}\r\ndata: ".encode()
+        _SSE_FRAME_PREFIXES[sse_event.event] = prefix
+    # 数据统一走pydantic的JSON模式序列化，与AgentSSEEvent的输出保持一致
+    return prefix + orjson.dumps(sse_event.data.model_dump(mode="json")) + b"\r\n\r\n"
 
-    @staticmethod
-    def _get_event_type_mapping() -> Dict[str, EventMapping]:
-        """通过反射动态构建从事件类型字符串到AgentSSEEvent的映射"""
-        # 1.判断缓存映射是否存在，如果存在则直接返回
-        if EventMapper._cache_mapping is not None:
-            return EventMapper._cache_mapping
-
-        # 2.获取AgentSSEEvent的所有可能存在类
-        sse_event_classes = get_args(AgentSSEEvent)
-        mapping = {}
-
-        # 3.循环遍历AgentSSEEvent可能的所有类逐个处理
-        for sse_event_class in sse_event_classes:
-            # 4.跳过基类
-            if sse_event_class == BaseSSEEvent:
-                continue
-
-            # 5.检查类是否包含event属性
-            if (
-                hasattr(sse_event_class, "__annotations__")
-                and "event" in sse_event_class.__annotations__
-            ):
-                # 6.提取事件字段
-                event_field = sse_event_class.__annotations__["event"]
-
-                # 7.提取事件的具体值(Literal的值)
-                if hasattr(event_field, "__args__") and len(event_field.__args__) > 0:
-                    event_type = event_field.__args__[0]
-
-                    # 8.提取sse的载荷数据
-                    data_class = None
-                    if (
-                        hasattr(sse_event_class, "__annotations__")
-                        and "data" in sse_event_class.__annotations__
-                    ):
-                        data_class = sse_event_class.__annotations__["data"]
-
-                    # 9.构建并注册映射关系
-                    mapping[event_type] = EventMapping(
-                        sse_event_class=sse_event_class,
-                        data_class=data_class,
-                        event_type=event_type,
-                    )
 
-        # 10.更新类级缓存
-        EventMapper._cache_mapping = mapping
-        return mapping
+# 事件类型字符串 -> 流式事件构建函数的显式分派表，新增流式事件类型时需在此登记
+_EVENT_DISPATCH: Dict[str, Callable[[Event], AgentSSEEvent]] = {
+    "message": MessageSSEEvent.from_event,
+    "title": TitleSSEEvent.from_event,
+    "step": StepSSEEvent.from_event,
+    "plan": PlanSSEEvent.from_event,
+    "tool": ToolSSEEvent.from_event,
+    "done": DoneSSEEvent.from_event,
+    "error": ErrorSSEEvent.from_event,
+    "wait": WaitSSEEvent.from_event,
+    "control": ControlSSEEvent.from_event,
+}
+
+
+class EventMapper:
+    """事件映射类，基于显式分派表将业务逻辑中的Event转换成适合流式传输的AgentSSEEvent"""
 
     @staticmethod
     def event_to_sse_event(event: Event) -> AgentSSEEvent:
         """将领域事件转换为Agent流式事件模型"""
-        # 1.获取事件映射表
-        event_type_mapping = EventMapper._get_event_type_mapping()
-
-        # 2.根据传递进来的事件获取映射类
-        event_mapping = event_type_mapping.get(event.type)
-
-        # 3.如果找到了类型映射则进行转换
-        if event_mapping:
-            sse_event = event_mapping.sse_event_class.from_event(event)
-            return sse_event
-
-        # 4.如果没找到类型则使用通用类型
+        # 按事件类型直接取出已绑定的构建函数，未登记的类型使用通用事件
+        from_event = _EVENT_DISPATCH.get(event.type)
+        if from_event is not None:
+            return from_event(event)
         return CommonSSEEvent.from_event(event)
 
     @staticmethod
     def events_to_sse_events(events: List[Event]) -> List[AgentSSEEvent]:
         """将领域事件模型列表转换为SSE流式事件列表"""
-        return list(
-            filter(
-                lambda x: x is not None,
-                [EventMapper.event_to_sse_event(event) for event in events],
-            )
-        )
+        # event_to_sse_event 总会返回事件(未注册类型回退为通用事件)，无需再过滤None
+        event_to_sse_event = EventMapper.event_to_sse_event
+        return [event_to_sse_event(event) for event in events]
@@ -5,7 +5,7 @@ from app.domain.models.file import File
 from app.domain.models.message import SkillConfirmationAction
 from app.domain.models.session import SessionStatus
 from app.interfaces.schemas.event import AgentSSEEvent
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CreateSessionResponse(BaseModel):
@@ -17,10 +17,13 @@ class CreateSessionResponse(BaseModel):
 class ListSessionItem(BaseModel):
     """会话列表条目基础信息"""
 
+    # 仅由服务端构建输出，不可变且不接受额外字段
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     session_id: str = ""
     title: str = ""
     latest_message: str = ""
-    latest_message_at: Optional[datetime] = Field(default_factory=datetime.now)
+    latest_message_at: Optional[datetime] = None
     status: SessionStatus = SessionStatus.PENDING
     unread_message_count: int = 0
 
@@ -31,6 +34,13 @@ class ListSessionResponse(BaseModel):
     sessions: List[ListSessionItem]
 
 
+class BatchSessionRequest(BaseModel):
+    """批量操作会话请求结构"""
+
+    op: Literal["clear", "delete", "stop"]  # 操作类型: 清除未读/删除/停止
+    session_ids: List[str] = Field(min_length=1, max_length=100)  # 会话id列表
+
+
 class ChatRequest(BaseModel):
     """聊天请求结构"""
 
@@ -80,6 +90,9 @@ class ShellReadRequest(BaseModel):
 class ConsoleRecord(BaseModel):
     """控制台记录模型，包含ps1、command、output"""
 
+    # 数据来自沙箱响应，保持忽略额外字段以兼容沙箱新增字段
+    model_config = ConfigDict(frozen=True)
+
     ps1: str
     command: str
     output: str
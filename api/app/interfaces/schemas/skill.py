@@ -4,7 +4,7 @@ from enum import Enum
 from typing import Any, Dict, List
 
 from app.domain.models.skill import SkillRuntimeType, SkillSourceType
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SkillInstallRequest(BaseModel):
@@ -25,6 +25,9 @@ class SkillInstallRequest(BaseModel):
 class SkillItem(BaseModel):
     """Skill 列表条目"""
 
+    # 仅由服务端构建输出，不可变且不接受额外字段
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     slug: str
     name: str
@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class UserStatusUpdateRequest(BaseModel):
@@ -24,9 +24,27 @@ class ToolPreferenceRequest(BaseModel):
     enabled: bool = Field(..., description="是否启用")
 
 
+class ToolPreferenceItem(BaseModel):
+    """单个工具偏好设置"""
+
+    tool_id: str = Field(..., min_length=1, description="工具 ID")
+    enabled: bool = Field(..., description="是否启用")
+
+
+class BatchToolPreferenceRequest(BaseModel):
+    """批量工具偏好请求"""
+
+    items: list[ToolPreferenceItem] = Field(
+        ..., min_length=1, max_length=200, description="工具偏好列表"
+    )
+
+
 class ToolWithPreference(BaseModel):
     """带用户偏好的工具信息"""
 
+    # 仅由服务端构建输出，不可变且不接受额外字段
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     tool_id: str = Field(..., description="工具 ID")
     tool_name: str = Field(..., description="工具名称")
     description: Optional[str] = Field(None, description="工具描述")
@@ -1,4 +1,7 @@
 import logging
+import os
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from app.application.services.agent_service import AgentService
 from app.application.services.app_config_service import AppConfigService
@@ -8,6 +11,9 @@ from app.application.services.skill_creator_service import SkillCreatorService
 from app.application.services.skill_export_service import SkillExportService
 from app.application.services.skill_service import SkillService
 from app.application.services.status_service import StatusService
+from app.application.services.user_tool_preference_service import (
+    UserToolPreferenceService,
+)
 
 # from app.domain.repositories.session_repository import SessionRepository
 from app.infrastructure.external.file_storage.minio_file_storage import MinioFileStorage
@@ -22,7 +28,7 @@ from app.infrastructure.external.health_checker.redis_health_checker import (
 )
 from app.infrastructure.external.json_parser.repair_json_parser import RepairJSONParser
 from app.domain.external.llm import LLM
-from app.domain.models.app_config import LLMConfig
+from app.domain.models.app_config import AppConfig, LLMConfig
 from app.infrastructure.external.llm.fallback_llm import FallbackLLM
 from app.infrastructure.external.llm.openai_llm import OpenAILLM
 from app.infrastructure.external.llm.openai_responses_llm import OpenAIResponsesLLM
@@ -36,6 +42,9 @@ from app.domain.models.context_overflow_config import ContextOverflowConfig
 from app.infrastructure.repositories.file_app_config_repository import (
     FileAppConfigRepository,
 )
+from app.infrastructure.repositories.db_user_tool_preference_repository import (
+    DBUserToolPreferenceRepository,
+)
 from app.infrastructure.repositories.file_skill_repository import FileSkillRepository
 from app.infrastructure.storage.minio import MinioStore, get_minio
 from app.infrastructure.storage.postgres import get_db_session, get_uow
@@ -46,12 +55,16 @@ from core.config import get_settings
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-# from functools import lru_cache
-
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# 应用配置解析结果缓存：(配置文件mtime_ns, 文件大小) -> AppConfig，文件变更后自动失效
+_app_config_cache: Optional[Tuple[Tuple[int, int], Optional[AppConfig]]] = None
+
+# LLM实例缓存：AppConfig实例 -> (主模型, 摘要模型)，配置重新加载后随之重建
+_llm_cache: Optional[Tuple[AppConfig, LLM, Optional[LLM]]] = None
+
 
 # @lru_cache()
 def get_app_config_service() -> AppConfigService:
@@ -65,7 +78,7 @@ def get_app_config_service() -> AppConfigService:
 
 
 # @lru_cache()
-def get_status_service(
+async def get_status_service(
     db_session: AsyncSession = Depends(get_db_session),
     redis_client: RedisClient = Depends(get_redis),
     minio_store: MinioStore = Depends(get_minio),
@@ -82,7 +95,7 @@ def get_status_service(
 
 
 # @lru_cache()
-def get_file_service(
+async def get_file_service(
     minio_store: MinioStore = Depends(get_minio),
 ) -> FileService:
     # 1.初始化文件仓库和文件存储桶
@@ -100,8 +113,9 @@ def get_file_service(
     )
 
 
-# @lru_cache()
-def get_session_service() -> SessionService:
+# 会话服务持有UoW实例(UoW保存db_session状态)，不能做成跨请求单例；
+# 构造本身无IO，使用async def避免FastAPI将同步依赖派发到线程池
+async def get_session_service() -> SessionService:
     return SessionService(
         uow_factory=get_uow,
         sandbox_cls=DockerSandbox,
@@ -109,11 +123,38 @@ def get_session_service() -> SessionService:
     )
 
 
-def _load_app_config():
+async def get_user_tool_preference_service(
+    db_session: AsyncSession = Depends(get_db_session),
+) -> UserToolPreferenceService:
+    """获取用户工具偏好服务，仓储与服务在同一依赖中构建"""
+    return UserToolPreferenceService(DBUserToolPreferenceRepository(db_session))
+
+
+def _get_cached_app_config() -> Optional[AppConfig]:
+    """加载应用配置，配置文件未变更时复用上次的解析结果，省去每次请求的YAML解析与校验
+
+    返回的实例在各请求间共享，只能读取，需要交给服务持有时先复制
+    """
+    global _app_config_cache
+
+    try:
+        stat = os.stat(settings.app_config_filepath)
+        file_key: Optional[Tuple[int, int]] = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        # 文件尚未创建，交给仓库创建默认配置，本次不缓存
+        file_key = None
+
+    cached = _app_config_cache
+    if file_key is not None and cached is not None and cached[0] == file_key:
+        return cached[1]
+
     app_config_repository = FileAppConfigRepository(
         config_path=settings.app_config_filepath
     )
-    return app_config_repository.load()
+    app_config = app_config_repository.load()
+    if file_key is not None:
+        _app_config_cache = (file_key, app_config)
+    return app_config
 
 
 def _build_llm(llm_config: LLMConfig) -> LLM:
@@ -133,13 +174,53 @@ def _build_llm(llm_config: LLMConfig) -> LLM:
     return OpenAILLM(llm_config)
 
 
+def _get_llms(app_config: AppConfig) -> Tuple[LLM, Optional[LLM]]:
+    """获取主模型与摘要模型，同一份应用配置下复用已创建的实例及其HTTP连接池"""
+    global _llm_cache
+
+    cached = _llm_cache
+    if cached is not None and cached[0] is app_config:
+        return cached[1], cached[2]
+
+    llm = _build_llm(app_config.llm_config)
+    summary_llm = None
+    if app_config.agent_config.memory.summary_model:
+        summary_llm_config = app_config.llm_config.model_copy(
+            update={"model_name": app_config.agent_config.memory.summary_model}
+        )
+        summary_llm = _build_llm(summary_llm_config)
+    _llm_cache = (app_config, llm, summary_llm)
+    return llm, summary_llm
+
+
+@lru_cache()
+def _get_json_parser() -> RepairJSONParser:
+    """lru_cache 单例：json解析器无状态，所有请求共享"""
+    return RepairJSONParser()
+
+
+@lru_cache()
+def _get_search_engine() -> BingSearchEngine:
+    """lru_cache 单例：搜索引擎，所有请求共享"""
+    return BingSearchEngine()
+
+
+@lru_cache(maxsize=1)
+def _get_file_storage(minio_store: MinioStore) -> MinioFileStorage:
+    """lru_cache 单例：基于MinIO单例构建的文件存储"""
+    return MinioFileStorage(
+        bucket=settings.minio_bucket_name,
+        minio_store=minio_store,
+        uow_factory=get_uow,
+    )
+
+
 def _build_skill_service() -> SkillService:
     return SkillService(FileSkillRepository(settings.skills_root_dir))
 
 
 def get_skill_creator_service() -> SkillCreatorService:
-    app_config = _load_app_config()
-    llm = _build_llm(app_config.llm_config)
+    llm, _ = _get_llms(_get_cached_app_config())
     github_client = GitHubSearchClient(token=settings.github_token or None)
     skill_service = _build_skill_service()
     return SkillCreatorService(
@@ -154,24 +235,16 @@ def get_agent_service(
     minio_store: MinioStore = Depends(get_minio),
     redis_client: RedisClient = Depends(get_redis),
 ) -> AgentService:
-    # 1.获取应用配置信息(读取配置需要实时获取,所以不配置缓存)
-    app_config = _load_app_config()
+    # 1.获取应用配置信息(配置需要实时生效，缓存以配置文件的修改时间为准)
+    shared_app_config = _get_cached_app_config()
+    # 每个服务持有独立的配置副本，避免某个请求内的修改泄漏到其他请求
+    app_config = shared_app_config.model_copy(deep=True)
     # file_repository = DBFileRepository(db_session=db_session)
     overflow_config = ContextOverflowConfig.from_llm_config(app_config.llm_config)
 
-    # 2.构建依赖实例
-    llm = _build_llm(app_config.llm_config)
-    summary_llm = None
-    if app_config.agent_config.memory.summary_model:
-        summary_llm_config = app_config.llm_config.model_copy(
-            update={"model_name": app_config.agent_config.memory.summary_model}
-        )
-        summary_llm = _build_llm(summary_llm_config)
-    file_storage = MinioFileStorage(
-        bucket=settings.minio_bucket_name,
-        minio_store=minio_store,
-        uow_factory=get_uow,
-    )
+    # 2.构建依赖实例，LLM/文件存储/解析器/搜索引擎均复用已创建的实例
+    llm, summary_llm = _get_llms(shared_app_config)
+    file_storage = _get_file_storage(minio_store)
     skill_creator_service = SkillCreatorService(
         llm=llm,
         github_client=GitHubSearchClient(token=settings.github_token or None),
@@ -189,8 +262,8 @@ def get_agent_service(
         skill_risk_policy=app_config.skill_risk_policy,
         sandbox_cls=DockerSandbox,
         task_cls=RedisStreamTask,
-        json_parser=RepairJSONParser(),
-        search_engine=BingSearchEngine(),
+        json_parser=_get_json_parser(),
+        search_engine=_get_search_engine(),
         file_storage=file_storage,
         redis_client=redis_client,
         skill_creator_service=skill_creator_service,
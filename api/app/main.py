@@ -1,20 +1,21 @@
 import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
-from alembic import command
-from alembic.config import Config
 from app.infrastructure.logging import setup_logging
 from app.infrastructure.storage.minio import get_minio
 from app.infrastructure.storage.postgres import get_postgres
 from app.infrastructure.storage.redis import get_redis
 from app.interfaces.endpoints.routes import router as api_router
 from app.interfaces.errors.exception_handlers import register_exception_handlers
-from app.interfaces.service_dependencies import get_agent_service
+from app.interfaces.schemas.auth import LoginRequest
 from core.config import get_settings
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 
 # 加载配置信息
@@ -35,9 +36,8 @@ openapi_tags = [
 ]
 
 
-def _build_alembic_database_url() -> str:
+def _build_alembic_database_url(db_url: str) -> str:
     """构建 Alembic 使用的数据库连接串（同步驱动 + 连接超时）"""
-    db_url = settings.sqlalchemy_database_url
     if db_url.startswith("postgresql+asyncpg://"):
         db_url = db_url.replace("postgresql+asyncpg://", "postgresql+psycopg2://", 1)
 
@@ -59,40 +59,60 @@ def _mask_database_url(url: str) -> str:
     return urlunparse(parsed._replace(netloc=netloc))
 
 
+def _run_database_migrations() -> None:
+    """运行数据库迁移(将数据同步到生产环境)，alembic为同步调用，由lifespan放到线程中执行"""
+    # alembic仅在迁移时使用，延迟导入缩短冷启动
+    from alembic import command
+    from alembic.config import Config
+
+    api_root = Path(__file__).resolve().parent.parent
+    alembic_cfg = Config(str(api_root / "alembic.ini"))
+    alembic_db_url = _build_alembic_database_url(settings.sqlalchemy_database_url)
+    alembic_cfg.set_main_option("sqlalchemy.url", alembic_db_url)
+    logger.info(f"数据库迁移开始，连接地址: {_mask_database_url(alembic_db_url)}")
+    started_at = time.perf_counter()
+    command.upgrade(alembic_cfg, "head")
+    logger.info(f"数据库迁移完成，耗时 {time.perf_counter() - started_at:.2f}s")
+
+
+async def _init_client(name: str, client: Any) -> None:
+    """初始化单个基础设施客户端并记录日志"""
+    logger.info(f"开始初始化 {name} 客户端")
+    await client.init()
+    logger.info(f"{name} 客户端初始化完成")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """创建FastAPI应用生命周期上下文管理器"""
     # 1.日志打印代码已经开始执行了
     logger.info("Manus应用正在初始化")
 
-    # 2.运行数据库迁移(将数据同步到生产环境)
-    _api_root = Path(__file__).resolve().parent.parent
-    alembic_cfg = Config(str(_api_root / "alembic.ini"))
-    alembic_db_url = _build_alembic_database_url()
-    alembic_cfg.set_main_option("sqlalchemy.url", alembic_db_url)
-    logger.info(f"数据库迁移开始，连接地址: {_mask_database_url(alembic_db_url)}")
-    command.upgrade(alembic_cfg, "head")
-    logger.info("数据库迁移完成")
-
-    # 3.初始化Redis/Postgres/Cos客户端
+    # 2.先完成数据库迁移，迁移失败时不初始化任何客户端
+    await asyncio.to_thread(_run_database_migrations)
 
-    # 2. 初始化Redis客户端
-    logger.info("开始初始化 Redis 客户端")
+    # 3.并发初始化Redis/Postgres/MinIO客户端，任一失败则关闭已初始化的客户端
     redis_client = get_redis()
-    await redis_client.init()
-    logger.info("Redis 客户端初始化完成")
-
-    # 3. 初始化Postgres数据库客户端
-    logger.info("开始初始化 Postgres 客户端")
     postgres_client = get_postgres()
-    await postgres_client.init()
-    logger.info("Postgres 客户端初始化完成")
-
-    # 4. 初始化MinIO对象存储客户端
-    logger.info("开始初始化 MinIO 客户端")
     minio_client = get_minio()
-    await minio_client.init()
-    logger.info("MinIO 客户端初始化完成")
+    results = await asyncio.gather(
+        _init_client("Redis", redis_client),
+        _init_client("Postgres", postgres_client),
+        _init_client("MinIO", minio_client),
+        return_exceptions=True,
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        await asyncio.gather(
+            redis_client.shutdown(),
+            postgres_client.shutdown(),
+            minio_client.shutdown(),
+            return_exceptions=True,
+        )
+        raise errors[0]
+
+    # 预热一次EmailStr校验，避免首个注册/登录请求承担email_validator的惰性初始化
+    LoginRequest.model_validate({"email": "warmup@example.com", "password": "warmup"})
 
     try:
         # 3.lifespan分界点
@@ -100,6 +120,8 @@ async def lifespan(app: FastAPI):
     finally:
         try:
             # 4.等待agent服务关闭
+            from app.interfaces.service_dependencies import get_agent_service
+
             logger.info("Manus应用正在关闭")
             await asyncio.wait_for(get_agent_service().shutdown(), timeout=30.0)
             logger.info("Agent服务成功关闭")
@@ -109,9 +131,11 @@ async def lifespan(app: FastAPI):
             logger.error(f"Agent服务关闭期间出现错误: {str(e)}")
 
         # 5. 应用关闭前的清理工作
-        await redis_client.shutdown()
-        await postgres_client.shutdown()
-        await minio_client.shutdown()
+        await asyncio.gather(
+            redis_client.shutdown(),
+            postgres_client.shutdown(),
+            minio_client.shutdown(),
+        )
         logger.info("Manus应用关闭成功")
 
 
@@ -121,6 +145,7 @@ app = FastAPI(
     lifespan=lifespan,
     openapi_tags=openapi_tags,
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # 配置CORS中间件，解决跨域问题
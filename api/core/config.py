@@ -1,6 +1,7 @@
 from functools import lru_cache
 from typing import Optional
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -33,6 +34,9 @@ class Settings(BaseSettings):
     rate_limit_connection_ttl_seconds: int = 120
     rate_limit_heartbeat_seconds: int = 30
 
+    # 健康检查结果缓存(秒)，0表示不缓存
+    health_check_cache_ttl_seconds: int = 5
+
     # MinIO对象存储配置
     minio_endpoint: str = "s3.example.com"
     minio_access_key: str = ""
@@ -40,6 +44,10 @@ class Settings(BaseSettings):
     minio_region: str | None = None
     minio_secure: bool = True
     minio_bucket_name: str = "a2a-mcp"
+    # 分片大小需在 MinIO 允许的 5MiB~5GiB 范围内
+    minio_upload_part_size: int = Field(
+        default=8 * 1024 * 1024, ge=5 * 1024 * 1024, le=5 * 1024 * 1024 * 1024
+    )
 
     # Sandbox配置
     sandbox_address: Optional[str] = None
@@ -93,10 +101,12 @@ class Settings(BaseSettings):
     )
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """获取应用程序的配置设置实例，使用lru_cache进行缓存以提高性能。
 
+    security等模块在导入时基于该实例派生常量，调用方可假定多次调用返回同一实例。
+
     Returns:
         Settings: 应用程序的配置设置实例。
     """
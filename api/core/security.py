@@ -1,11 +1,35 @@
 """安全工具模块：JWT 签发验证、密码哈希"""
 
-from datetime import datetime, timedelta, timezone
+import asyncio
+import time
+from datetime import timedelta
 from typing import Any, Optional
 
 import bcrypt
+import jwt
 from core.config import get_settings
-from jose import JWTError, jwt
+
+settings = get_settings()
+
+# token 默认有效期(秒)，exp 直接使用 RFC 7519 的数值时间戳，省去每次签发的 datetime 运算
+_ACCESS_TOKEN_EXPIRE_SECONDS = settings.jwt_access_token_expire_minutes * 60
+_REFRESH_TOKEN_EXPIRE_SECONDS = settings.jwt_refresh_token_expire_days * 24 * 60 * 60
+
+# 密钥与算法在导入时固定，避免每次签发/校验重复读取配置并编码密钥
+_JWT_ALGORITHM = settings.jwt_algorithm
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+_JWT_SECRET_KEY_BYTES = settings.jwt_secret_key.encode("utf-8")
+
+# bcrypt 限制密码最大长度为 72 字节
+_BCRYPT_MAX_PASSWORD_BYTES = 72
+
+
+def _bcrypt_password_bytes(password: str) -> bytes:
+    """编码密码，仅在超过 bcrypt 长度限制时截断"""
+    password_bytes = password.encode("utf-8")
+    if len(password_bytes) > _BCRYPT_MAX_PASSWORD_BYTES:
+        password_bytes = password_bytes[:_BCRYPT_MAX_PASSWORD_BYTES]
+    return password_bytes
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -18,8 +42,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: 密码是否匹配
     """
-    # bcrypt 限制密码最大长度为 72 字节，需要与哈希时保持一致
-    password_bytes = plain_password.encode("utf-8")[:72]
+    # 截断规则需要与哈希时保持一致
+    password_bytes = _bcrypt_password_bytes(plain_password)
     try:
         return bcrypt.checkpw(password_bytes, hashed_password.encode("utf-8"))
     except (ValueError, TypeError):
@@ -36,11 +60,27 @@ def get_password_hash(password: str) -> str:
     Returns:
         str: 哈希后的密码
     """
-    # bcrypt 限制密码最大长度为 72 字节，超过需要截断
-    password_bytes = password.encode("utf-8")[:72]
+    password_bytes = _bcrypt_password_bytes(password)
     return bcrypt.hashpw(password_bytes, bcrypt.gensalt()).decode("utf-8")
 
 
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """在线程中验证密码，供异步调用方使用
+
+    bcrypt 计算在原生扩展中释放 GIL，放到默认线程池执行，避免阻塞事件循环
+    """
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
+async def aget_password_hash(password: str) -> str:
+    """在线程中生成密码哈希，供异步调用方使用"""
+    return await asyncio.to_thread(get_password_hash, password)
+
+
+def _encode_token(to_encode: dict[str, Any]) -> str:
+    return jwt.encode(to_encode, _JWT_SECRET_KEY_BYTES, algorithm=_JWT_ALGORITHM)
+
+
 def create_access_token(
     data: dict[str, Any],
     expires_delta: Optional[timedelta] = None,
@@ -54,23 +94,16 @@ def create_access_token(
     Returns:
         str: JWT access token
     """
-    settings = get_settings()
     to_encode = data.copy()
 
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=settings.jwt_access_token_expire_minutes
-        )
-
-    to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm,
+    expire_seconds = (
+        int(expires_delta.total_seconds())
+        if expires_delta
+        else _ACCESS_TOKEN_EXPIRE_SECONDS
     )
-    return encoded_jwt
+
+    to_encode.update({"exp": int(time.time()) + expire_seconds, "type": "access"})
+    return _encode_token(to_encode)
 
 
 def create_refresh_token(
@@ -86,23 +119,16 @@ def create_refresh_token(
     Returns:
         str: JWT refresh token
     """
-    settings = get_settings()
     to_encode = data.copy()
 
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            days=settings.jwt_refresh_token_expire_days
-        )
-
-    to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm,
+    expire_seconds = (
+        int(expires_delta.total_seconds())
+        if expires_delta
+        else _REFRESH_TOKEN_EXPIRE_SECONDS
     )
-    return encoded_jwt
+
+    to_encode.update({"exp": int(time.time()) + expire_seconds, "type": "refresh"})
+    return _encode_token(to_encode)
 
 
 def decode_token(token: str) -> Optional[dict[str, Any]]:
@@ -114,15 +140,10 @@ def decode_token(token: str) -> Optional[dict[str, Any]]:
     Returns:
         Optional[dict]: 解码后的 payload，验证失败返回 None
     """
-    settings = get_settings()
     try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
+        payload = jwt.decode(token, _JWT_SECRET_KEY_BYTES, algorithms=_JWT_ALGORITHMS)
         return payload
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
 
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from datetime import datetime
 from pathlib import Path
 
+import orjson
 from app.domain.models.skill import Skill, SkillSourceType, build_skill_key
 from app.domain.models.user_tool_preference import ToolType
 from app.infrastructure.models.user_tool_preference import UserToolPreferenceModel
@@ -15,6 +15,12 @@ from sqlalchemy import select
 
 from core.config import get_settings
 
+# 写入文件系统Skill仓库的最大并发数
+UPSERT_CONCURRENCY = 32
+
+# 文件系统Skill仓库支持的来源类型，其余来源统一归为LOCAL
+_VALID_SOURCES = frozenset({SkillSourceType.LOCAL, SkillSourceType.GITHUB})
+
 
 def _serialize_skill(skill: Skill) -> dict:
     payload = skill.model_dump()
@@ -52,12 +58,14 @@ async def migrate() -> None:
         prefs_result = await session.execute(prefs_stmt)
         prefs = list(prefs_result.scalars().all())
 
-        (snapshot_root / "skills.json").write_text(
-            json.dumps([_serialize_skill(skill) for skill in skills], ensure_ascii=False, indent=2),
-            encoding="utf-8",
+        (snapshot_root / "skills.json").write_bytes(
+            orjson.dumps(
+                [_serialize_skill(skill) for skill in skills],
+                option=orjson.OPT_INDENT_2,
+            )
         )
-        (snapshot_root / "skill_preferences.json").write_text(
-            json.dumps(
+        (snapshot_root / "skill_preferences.json").write_bytes(
+            orjson.dumps(
                 [
                     {
                         "id": pref.id,
@@ -70,28 +78,36 @@ async def migrate() -> None:
                     }
                     for pref in prefs
                 ],
-                ensure_ascii=False,
-                indent=2,
-            ),
-            encoding="utf-8",
+                option=orjson.OPT_INDENT_2,
+            )
         )
 
+        # 同一skill_key只保留最后一条(与逐条写入的覆盖结果一致)，避免并发写同一目录
+        migrated_by_key: dict[str, Skill] = {}
         for skill in skills:
             normalized_source = (
                 skill.source_type
-                if skill.source_type in {SkillSourceType.LOCAL, SkillSourceType.GITHUB}
+                if skill.source_type in _VALID_SOURCES
                 else SkillSourceType.LOCAL
             )
             skill_key = build_skill_key(skill.slug, normalized_source, skill.source_ref)
             mapping[skill.id] = skill_key
-            migrated = skill.model_copy(
-                deep=True,
+            # 文件仓库写入时只读取manifest(先复制再修改)，浅拷贝即可
+            migrated_by_key[skill_key] = skill.model_copy(
                 update={
                     "id": skill_key,
                     "source_type": normalized_source,
                 },
             )
-            await fs_repo.upsert(migrated)
+
+        # 各Skill目录互不相关，限制并发数后并行写入文件系统
+        semaphore = asyncio.Semaphore(UPSERT_CONCURRENCY)
+
+        async def _upsert(migrated: Skill) -> None:
+            async with semaphore:
+                await fs_repo.upsert(migrated)
+
+        await asyncio.gather(*(_upsert(item) for item in migrated_by_key.values()))
 
         for pref in prefs:
             if pref.tool_id in mapping:
@@ -104,9 +120,8 @@ async def migrate() -> None:
         "mapped_preferences": len(mapping),
         "mapping": mapping,
     }
-    (snapshot_root / "mapping.json").write_text(
-        json.dumps(report, ensure_ascii=False, indent=2),
-        encoding="utf-8",
+    (snapshot_root / "mapping.json").write_bytes(
+        orjson.dumps(report, option=orjson.OPT_INDENT_2)
     )
     print(f"[migrate] snapshot={snapshot_root}")
     print(f"[migrate] migrated_skills={len(mapping)}")
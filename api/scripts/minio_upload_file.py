@@ -29,11 +29,8 @@ async def main() -> None:
     if not object_name:
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
         prefix_clean = args.prefix.strip().strip("/").replace("\\", "/")
-        object_name = (
-            f"{prefix_clean}/{timestamp}-{uuid4().hex}-{path.name}"
-            if prefix_clean
-            else f"{timestamp}-{uuid4().hex}-{path.name}"
-        )
+        base_name = f"{timestamp}-{uuid4().hex}-{path.name}"
+        object_name = f"{prefix_clean}/{base_name}" if prefix_clean else base_name
 
     store = get_minio()
     await store.init()
@@ -43,14 +40,13 @@ async def main() -> None:
         raise SystemExit(f"Bucket not exists: {bucket_name}")
 
     size = path.stat().st_size
-    with path.open("rb") as f:
-        result = await store.upload_fileobj(
-            bucket_name=bucket_name,
-            object_name=object_name,
-            data=f,
-            length=size,
-            content_type="application/octet-stream",
-        )
+    result = await store.upload_file(
+        bucket_name=bucket_name,
+        object_name=object_name,
+        file_path=str(path),
+        content_type="application/octet-stream",
+        part_size=settings.minio_upload_part_size,
+    )
 
     if not args.no_presign:
         result["presigned_get_url"] = await store.presigned_get_url(
@@ -23,11 +23,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.domain.models.user import UserRole
 from app.infrastructure.models.user import UserModel
-from core.config import settings
-from core.security import get_password_hash
+from app.infrastructure.storage.postgres import create_ephemeral_engine
+from core.security import aget_password_hash
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 
 def parse_args() -> argparse.Namespace:
@@ -95,23 +94,27 @@ async def main() -> int:
         print(f"❌ {exc}")
         return 1
 
-    engine = create_async_engine(settings.sqlalchemy_database_url, echo=False)
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    engine = create_ephemeral_engine()
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
 
-    async with async_session() as session:
-        user = await find_admin_user(session, args.username, args.email)
-        if not user:
-            print("❌ 未找到匹配的超级管理员账户")
-            return 1
-
-        user.password_hash = get_password_hash(new_password)
-        await session.commit()
-
-        print("✅ 超级管理员密码已重置")
-        print(f"   用户ID: {user.id}")
-        print(f"   用户名: {user.username or '(未设置)'}")
-        print(f"   邮箱: {user.email or '(未设置)'}")
-        return 0
+    try:
+        async with async_session() as session:
+            user = await find_admin_user(session, args.username, args.email)
+            if not user:
+                print("❌ 未找到匹配的超级管理员账户")
+                return 1
+
+            user.password_hash = await aget_password_hash(new_password)
+            await session.commit()
+
+            print("✅ 超级管理员密码已重置")
+            print(f"   用户ID: {user.id}")
+            print(f"   用户名: {user.username or '(未设置)'}")
+            print(f"   邮箱: {user.email or '(未设置)'}")
+            return 0
+    finally:
+        # 脚本单次运行，显式释放引擎，避免连接遗留到事件循环关闭时
+        await engine.dispose()
 
 
 if __name__ == "__main__":
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import os
 from datetime import datetime
 from pathlib import Path
 
+import orjson
 from app.domain.models.skill import Skill
 from app.domain.models.user_tool_preference import ToolType
 from app.infrastructure.models.skill import SkillModel
 from app.infrastructure.models.user_tool_preference import UserToolPreferenceModel
 from app.infrastructure.storage.postgres import get_postgres
-from sqlalchemy import delete
+from sqlalchemy import delete, insert
 
 from core.config import get_settings
 
@@ -19,28 +20,59 @@ def _latest_snapshot(skills_root: Path) -> Path:
     snapshots_root = skills_root / "_migration" / "snapshots"
     if not snapshots_root.exists():
         raise RuntimeError("未找到迁移快照目录")
-    snapshots = sorted(
-        [path for path in snapshots_root.iterdir() if path.is_dir()],
-        key=lambda path: path.name,
-    )
-    if not snapshots:
+    # scandir的DirEntry缓存了文件类型，快照名按时间戳命名，直接取最大值即可
+    with os.scandir(snapshots_root) as entries:
+        names = [entry.name for entry in entries if entry.is_dir()]
+    if not names:
         raise RuntimeError("未找到可回滚快照")
-    return snapshots[-1]
+    return snapshots_root / max(names)
 
 
 def _parse_datetime(value: str) -> datetime:
     return datetime.fromisoformat(value)
 
 
+def _skill_row(raw: dict) -> dict:
+    """校验快照中的Skill记录并转换为skills表的行数据"""
+    raw["created_at"] = _parse_datetime(raw["created_at"])
+    raw["updated_at"] = _parse_datetime(raw["updated_at"])
+    skill = Skill.model_validate(raw)
+    return {
+        "id": skill.id,
+        "slug": skill.slug,
+        "name": skill.name,
+        "description": skill.description,
+        "version": skill.version,
+        "source_type": skill.source_type.value,
+        "source_ref": skill.source_ref,
+        "runtime_type": skill.runtime_type.value,
+        "manifest": skill.manifest,
+        "enabled": skill.enabled,
+        "installed_by": skill.installed_by,
+        "created_at": skill.created_at,
+        "updated_at": skill.updated_at,
+    }
+
+
+def _preference_row(raw: dict) -> dict:
+    return {
+        "id": raw["id"],
+        "user_id": raw["user_id"],
+        "tool_type": raw["tool_type"],
+        "tool_id": raw["tool_id"],
+        "enabled": bool(raw["enabled"]),
+        "created_at": _parse_datetime(raw["created_at"]),
+        "updated_at": _parse_datetime(raw["updated_at"]),
+    }
+
+
 async def rollback() -> None:
     settings = get_settings()
     skills_root = Path(settings.skills_root_dir)
     snapshot = _latest_snapshot(skills_root)
 
-    skills_data = json.loads((snapshot / "skills.json").read_text(encoding="utf-8"))
-    prefs_data = json.loads(
-        (snapshot / "skill_preferences.json").read_text(encoding="utf-8")
-    )
+    skills_data = orjson.loads((snapshot / "skills.json").read_bytes())
+    prefs_data = orjson.loads((snapshot / "skill_preferences.json").read_bytes())
 
     postgres = get_postgres()
     await postgres.init()
@@ -53,24 +85,13 @@ async def rollback() -> None:
             )
         )
 
-        for raw in skills_data:
-            raw["created_at"] = _parse_datetime(raw["created_at"])
-            raw["updated_at"] = _parse_datetime(raw["updated_at"])
-            skill = Skill.model_validate(raw)
-            session.add(SkillModel.from_domain(skill))
-
-        for raw in prefs_data:
-            session.add(
-                UserToolPreferenceModel(
-                    id=raw["id"],
-                    user_id=raw["user_id"],
-                    tool_type=raw["tool_type"],
-                    tool_id=raw["tool_id"],
-                    enabled=bool(raw["enabled"]),
-                    created_at=_parse_datetime(raw["created_at"]),
-                    updated_at=_parse_datetime(raw["updated_at"]),
-                )
-            )
+        # 批量插入，一次executemany代替逐条session.add
+        skill_rows = [_skill_row(raw) for raw in skills_data]
+        if skill_rows:
+            await session.execute(insert(SkillModel), skill_rows)
+        preference_rows = [_preference_row(raw) for raw in prefs_data]
+        if preference_rows:
+            await session.execute(insert(UserToolPreferenceModel), preference_rows)
 
         await session.commit()
 
@@ -1,40 +1,16 @@
 import asyncio
+from unittest.mock import AsyncMock
 
 import pytest
 from app.application.services.agent_service import AgentService
 from app.domain.models.app_config import A2AConfig, AgentConfig, MCPConfig
 from app.domain.models.session import Session, SessionStatus
-
-pytestmark = pytest.mark.anyio
-
-
-@pytest.fixture
-def anyio_backend() -> str:
-    return "asyncio"
-
-
-class _SessionRepo:
-    def __init__(self) -> None:
-        self.update_status_calls: list[tuple[str, SessionStatus]] = []
-        self.update_latest_message_calls: list[tuple[str, str]] = []
-        self.add_event_calls: list[tuple[str, object]] = []
-
-    async def update_status(self, session_id: str, status: SessionStatus) -> None:
-        self.update_status_calls.append((session_id, status))
-
-    async def update_latest_message(self, session_id: str, message: str, timestamp) -> None:
-        self.update_latest_message_calls.append((session_id, message))
-
-    async def add_event(self, session_id: str, event) -> None:
-        self.add_event_calls.append((session_id, event))
-
-    async def update_unread_message_count(self, session_id: str, count: int) -> None:
-        return None
+from app.domain.repositories.session_repository import SessionRepository
 
 
 class _Uow:
     def __init__(self) -> None:
-        self.session = _SessionRepo()
+        self.session = AsyncMock(spec=SessionRepository)
 
     async def __aenter__(self) -> "_Uow":
         return self
@@ -49,25 +25,17 @@ class _Uow:
         return None
 
 
-class _DummyInputStream:
-    async def put(self, event_json: str) -> str:
-        return "evt-user-1"
-
-
-class _DummyOutputStream:
-    def __init__(self, owner: "_DummyTask") -> None:
-        self._owner = owner
-
-    async def get(self, start_id: str = None, block_ms: int = None):
-        self._owner.done_flag = True
-        return None, None
-
-
 class _DummyTask:
     def __init__(self) -> None:
         self.done_flag = False
-        self.input_stream = _DummyInputStream()
-        self.output_stream = _DummyOutputStream(self)
+        self.input_stream = AsyncMock()
+        self.input_stream.put.return_value = "evt-user-1"
+        self.output_stream = AsyncMock()
+        self.output_stream.get.side_effect = self._get_output
+
+    def _get_output(self, start_id: str = None, block_ms: int = None):
+        self.done_flag = True
+        return None, None
 
     @property
     def done(self) -> bool:
@@ -77,102 +45,114 @@ class _DummyTask:
         return None
 
 
-def _make_service(uow: _Uow) -> AgentService:
-    return AgentService(
-        uow_factory=lambda: uow,
-        llm=object(),
-        agent_config=AgentConfig(max_iterations=100, max_retries=3, max_search_results=10),
-        mcp_config=MCPConfig(),
-        a2a_config=A2AConfig(),
-        sandbox_cls=object,
-        task_cls=object,
-        json_parser=object(),
-        search_engine=object(),
-        file_storage=object(),
-    )
+# chat只通过model_copy派生新会话，不会修改该实例，可在用例间共享
+_RUNNING_SESSION = Session(
+    id="session-1", user_id="user-1", status=SessionStatus.RUNNING
+)
 
 
-async def test_chat_without_message_reconciles_running_status_when_task_missing(
-    monkeypatch,
-) -> None:
-    uow = _Uow()
-    service = _make_service(uow)
+class _StubbedAgentService(AgentService):
+    """会话查询、任务创建等依赖外部资源的方法直接返回预设值"""
+
+    session_override: Session = _RUNNING_SESSION
+    created_task: _DummyTask | None = None
 
-    async def fake_get_accessible_session(*args, **kwargs) -> Session:
-        return Session(id="session-1", user_id="user-1", status=SessionStatus.RUNNING)
+    async def _get_accessible_session(self, *args, **kwargs) -> Session:
+        return self.session_override
 
-    async def fake_check_attachments_access(*args, **kwargs) -> None:
+    async def _check_attachments_access(self, *args, **kwargs) -> None:
         return None
 
-    async def fake_get_task(_session: Session):
+    async def _get_task(self, session: Session):
         return None
 
-    async def fake_safe_update_unread_count(_session_id: str) -> None:
+    async def _create_task(self, session: Session):
+        return self.created_task
+
+    async def _safe_update_unread_count(self, session_id: str) -> None:
         return None
 
-    monkeypatch.setattr(service, "_get_accessible_session", fake_get_accessible_session)
-    monkeypatch.setattr(service, "_check_attachments_access", fake_check_attachments_access)
-    monkeypatch.setattr(service, "_get_task", fake_get_task)
-    monkeypatch.setattr(service, "_safe_update_unread_count", fake_safe_update_unread_count)
-
-    chat_gen = service.chat(
-        session_id="session-1",
-        user_id="user-1",
-        message=None,
-        attachments=None,
-        latest_event_id=None,
-        timestamp=None,
+
+@pytest.fixture(scope="session")
+def agent_configs() -> tuple[AgentConfig, MCPConfig, A2AConfig]:
+    # 配置在各用例间只读，整个测试会话只构建一次
+    return (
+        AgentConfig(max_iterations=100, max_retries=3, max_search_results=10),
+        MCPConfig(),
+        A2AConfig(),
     )
 
-    with pytest.raises(StopAsyncIteration):
-        await asyncio.wait_for(chat_gen.__anext__(), timeout=0.2)
 
-    assert uow.session.update_status_calls == [
-        ("session-1", SessionStatus.COMPLETED),
-    ]
+@pytest.fixture
+def uow() -> _Uow:
+    return _Uow()
 
 
-async def test_chat_with_message_does_not_trigger_running_status_reconcile(
-    monkeypatch,
-) -> None:
-    uow = _Uow()
-    service = _make_service(uow)
-    created_task = _DummyTask()
+@pytest.fixture
+def service(
+    uow: _Uow, agent_configs: tuple[AgentConfig, MCPConfig, A2AConfig]
+) -> _StubbedAgentService:
+    agent_config, mcp_config, a2a_config = agent_configs
+    return _StubbedAgentService(
+        uow_factory=lambda: uow,
+        llm=object(),
+        agent_config=agent_config,
+        mcp_config=mcp_config,
+        a2a_config=a2a_config,
+        sandbox_cls=object,
+        task_cls=object,
+        json_parser=object(),
+        search_engine=object(),
+        file_storage=object(),
+    )
 
-    async def fake_get_accessible_session(*args, **kwargs) -> Session:
-        return Session(id="session-1", user_id="user-1", status=SessionStatus.RUNNING)
 
-    async def fake_check_attachments_access(*args, **kwargs) -> None:
-        return None
+def test_chat_without_message_reconciles_running_status_when_task_missing(
+    uow: _Uow, service: _StubbedAgentService
+) -> None:
 
-    async def fake_get_task(_session: Session):
-        return None
+    async def _run() -> None:
+        chat_gen = service.chat(
+            session_id="session-1",
+            user_id="user-1",
+            message=None,
+            attachments=None,
+            latest_event_id=None,
+            timestamp=None,
+        )
 
-    async def fake_create_task(_session: Session):
-        return created_task
+        with pytest.raises(StopAsyncIteration):
+            await chat_gen.__anext__()
 
-    async def fake_safe_update_unread_count(_session_id: str) -> None:
-        return None
+    asyncio.run(_run())
 
-    monkeypatch.setattr(service, "_get_accessible_session", fake_get_accessible_session)
-    monkeypatch.setattr(service, "_check_attachments_access", fake_check_attachments_access)
-    monkeypatch.setattr(service, "_get_task", fake_get_task)
-    monkeypatch.setattr(service, "_create_task", fake_create_task)
-    monkeypatch.setattr(service, "_safe_update_unread_count", fake_safe_update_unread_count)
-
-    chat_gen = service.chat(
-        session_id="session-1",
-        user_id="user-1",
-        message="hello",
-        attachments=None,
-        latest_event_id=None,
-        timestamp=None,
+    uow.session.update_status.assert_awaited_once_with(
+        "session-1", SessionStatus.COMPLETED
     )
 
-    first_event = await asyncio.wait_for(chat_gen.__anext__(), timeout=0.2)
-    assert first_event.type == "message"
-    assert first_event.role == "user"
-    assert first_event.message == "hello"
-    assert uow.session.update_status_calls == []
 
-    await chat_gen.aclose()
+def test_chat_with_message_does_not_trigger_running_status_reconcile(
+    uow: _Uow, service: _StubbedAgentService
+) -> None:
+    service.created_task = _DummyTask()
+
+    async def _run() -> None:
+        chat_gen = service.chat(
+            session_id="session-1",
+            user_id="user-1",
+            message="hello",
+            attachments=None,
+            latest_event_id=None,
+            timestamp=None,
+        )
+
+        # 用户消息在读取输出流之前产出，直接等待即可，无需计时器兜底
+        first_event = await chat_gen.__anext__()
+        assert first_event.type == "message"
+        assert first_event.role == "user"
+        assert first_event.message == "hello"
+        uow.session.update_status.assert_not_awaited()
+
+        await chat_gen.aclose()
+
+    asyncio.run(_run())
@@ -66,3 +66,12 @@ def test_create_task_sets_tz_for_spawned_sandbox_container(monkeypatch) -> None:
     assert fake_docker_client.containers.run_kwargs["environment"]["TZ"] == "Asia/Shanghai"
     assert fake_docker_client.containers.run_kwargs["network"] == "actus-net"
     assert fake_docker_client.closed is True
+
+
+def test_get_shell_ws_target_url_quotes_and_caches_session_id() -> None:
+    sandbox = DockerSandbox(ip="172.18.0.2", container_name="actus-sb-1")
+
+    target_url = sandbox.get_shell_ws_target_url("takeover s1/tk")
+
+    assert target_url == "ws://172.18.0.2:8080/api/shell/ws?session_id=takeover%20s1%2Ftk"
+    assert sandbox.get_shell_ws_target_url("takeover s1/tk") is target_url
@@ -8,6 +8,7 @@ from app.interfaces.dependencies.rate_limit import (
     RateLimitBucket,
     RateLimitChannel,
     acquire_connection_limit,
+    acquire_limited_connection,
     enforce_request_limit,
 )
 
@@ -80,6 +81,29 @@ class FakeRedis:
         return existed
 
 
+    def register_script(self, script: str):
+        async def _run(keys: list[str], args: list):
+            # 模拟合并限流脚本的执行语义
+            if self.fail:
+                raise RuntimeError("redis unavailable")
+            request_key, connection_key = keys
+            limit, window_seconds, now, ttl, connection_limit, member = args
+            current = await self.incr(request_key)
+            if current == 1:
+                await self.expire(request_key, window_seconds + 1)
+            if current > limit:
+                return [1, await self.ttl(request_key)]
+            await self.zremrangebyscore(connection_key, 0, now - ttl)
+            if await self.zcard(connection_key) >= connection_limit:
+                oldest = await self.zrange(connection_key, 0, 0, withscores=True)
+                return [2, str(oldest[0][1]) if oldest else ""]
+            await self.zadd(connection_key, {member: now})
+            await self.expire(connection_key, ttl)
+            return [0, ""]
+
+        return _run
+
+
 class FakeRedisClient:
     def __init__(self, redis: FakeRedis) -> None:
         self.client = redis
@@ -134,3 +158,62 @@ def test_connection_limit_exceeded_returns_429() -> None:
                 redis_client=FakeRedisClient(redis),
             )
         )
+
+
+def test_limited_connection_registers_lease_in_single_script() -> None:
+    redis = FakeRedis()
+    user = User(id="u-ws")
+
+    lease = asyncio.run(
+        acquire_limited_connection(
+            bucket=RateLimitBucket.READ,
+            channel=RateLimitChannel.WS,
+            current_user=user,
+            redis_client=FakeRedisClient(redis),
+        )
+    )
+
+    assert lease.key == f"rl:conn:{RateLimitChannel.WS.value}:{user.id}"
+    assert lease.member in redis.zsets[lease.key]
+    assert sum(redis.counters.values()) == 1
+
+
+def test_limited_connection_request_limit_exceeded_returns_429() -> None:
+    redis = FakeRedis()
+    redis.force_incr = 121
+    user = User(id="u-ws")
+
+    with pytest.raises(TooManyRequestsError) as exc:
+        asyncio.run(
+            acquire_limited_connection(
+                bucket=RateLimitBucket.READ,
+                channel=RateLimitChannel.WS,
+                current_user=user,
+                redis_client=FakeRedisClient(redis),
+            )
+        )
+
+    assert exc.value.data
+    assert exc.value.data["bucket"] == "read"
+    assert not redis.zsets
+
+
+def test_limited_connection_concurrency_exceeded_returns_429() -> None:
+    redis = FakeRedis()
+    user = User(id="u-ws")
+    key = f"rl:conn:{RateLimitChannel.WS.value}:{user.id}"
+    now = time.time()
+    redis.zsets[key] = {f"conn-{idx}": now for idx in range(10)}
+
+    with pytest.raises(TooManyRequestsError) as exc:
+        asyncio.run(
+            acquire_limited_connection(
+                bucket=RateLimitBucket.READ,
+                channel=RateLimitChannel.WS,
+                current_user=user,
+                redis_client=FakeRedisClient(redis),
+            )
+        )
+
+    assert exc.value.data
+    assert exc.value.data["bucket"] == RateLimitChannel.WS.value
@@ -1,7 +1,7 @@
 import asyncio
 
 import pytest
-from app.application.errors.exceptions import ForbiddenError
+from app.application.errors.exceptions import ForbiddenError, NotFoundError
 from app.application.services.session_service import SessionService
 from app.domain.models.session import Session
 
@@ -10,6 +10,7 @@ class FakeSessionRepo:
     def __init__(self, session: Session | None, all_sessions: list[Session] | None = None):
         self._session = session
         self._all_sessions = all_sessions or ([] if session is None else [session])
+        self.unread_updates: list[tuple[str, int]] = []
 
     async def get_by_id(self, session_id: str):
         if not self._session:
@@ -26,6 +27,9 @@ class FakeSessionRepo:
         self._session = session
         return session
 
+    async def update_unread_message_count(self, session_id: str, count: int) -> None:
+        self.unread_updates.append((session_id, count))
+
 
 class FakeUnitOfWork:
     def __init__(self, session: Session | None, all_sessions: list[Session] | None = None):
@@ -115,3 +119,33 @@ def test_get_vnc_url_auto_creates_sandbox_when_missing() -> None:
 
     vnc_url = asyncio.run(service.get_vnc_url("s1", user_id="owner", is_admin=False))
     assert vnc_url == "ws://127.0.0.1:5901"
+
+
+def test_clear_unread_message_counts_checks_access_before_updating() -> None:
+    session = Session(id="s1", title="demo", user_id="owner")
+    uow = FakeUnitOfWork(session=session)
+    service = SessionService(uow_factory=lambda: uow, sandbox_cls=FakeSandbox)
+
+    with pytest.raises(ForbiddenError):
+        asyncio.run(
+            service.clear_unread_message_counts(
+                ["s1"], user_id="visitor", is_admin=False
+            )
+        )
+    assert uow.session.unread_updates == []
+
+    asyncio.run(
+        service.clear_unread_message_counts(["s1"], user_id="owner", is_admin=False)
+    )
+    assert uow.session.unread_updates == [("s1", 0)]
+
+
+def test_check_sessions_access_rejects_when_any_session_is_missing() -> None:
+    session = Session(id="s1", title="demo", user_id="owner")
+    service = SessionService(
+        uow_factory=make_uow_factory(session=session), sandbox_cls=FakeSandbox
+    )
+
+    asyncio.run(service.check_sessions_access(["s1"], user_id="owner"))
+    with pytest.raises(NotFoundError):
+        asyncio.run(service.check_sessions_access(["s1", "s2"], user_id="owner"))
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import pytest
+from app.application.errors.exceptions import ConflictError, ForbiddenError
+from app.domain.models.user import User, UserRole, UserStatus
+from app.interfaces.dependencies.auth import get_current_user
+from app.interfaces.dependencies.rate_limit import rate_limit_write
+from app.interfaces.service_dependencies import get_agent_service, get_session_service
+from app.main import app
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def _fake_user() -> User:
+    return User(
+        id="test-user",
+        username="tester",
+        role=UserRole.USER,
+        status=UserStatus.ACTIVE,
+    )
+
+
+async def _noop_rate_limit() -> None:
+    return None
+
+
+class _FakeSessionService:
+    def __init__(
+        self,
+        forbidden: bool = False,
+        failing_ids: tuple[str, ...] = (),
+    ) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self._forbidden = forbidden
+        self._failing_ids = failing_ids
+
+    async def clear_unread_message_counts(self, **kwargs):
+        self.calls.append(("clear_unread_message_counts", kwargs))
+
+    async def check_sessions_access(self, **kwargs):
+        self.calls.append(("check_sessions_access", kwargs))
+        if self._forbidden:
+            raise ForbiddenError("无权访问该会话")
+
+    async def delete_session(self, **kwargs):
+        self.calls.append(("delete_session", kwargs))
+        if kwargs["session_id"] in self._failing_ids:
+            raise ConflictError("会话正在运行")
+
+
+class _FakeAgentService:
+    def __init__(self, failing_ids: tuple[str, ...] = ()) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self._failing_ids = failing_ids
+
+    async def stop_session(self, **kwargs):
+        self.calls.append(("stop_session", kwargs))
+        if kwargs["session_id"] in self._failing_ids:
+            raise RuntimeError("sandbox unreachable")
+
+
+async def _batch(
+    payload: dict,
+    *,
+    session_service: _FakeSessionService,
+    agent_service: _FakeAgentService,
+) -> httpx.Response:
+    app.dependency_overrides[get_current_user] = _fake_user
+    app.dependency_overrides[get_session_service] = lambda: session_service
+    app.dependency_overrides[get_agent_service] = lambda: agent_service
+    app.dependency_overrides[rate_limit_write] = _noop_rate_limit
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://test",
+        ) as client:
+            return await client.post("/api/sessions/batch", json=payload)
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+        app.dependency_overrides.pop(get_session_service, None)
+        app.dependency_overrides.pop(get_agent_service, None)
+        app.dependency_overrides.pop(rate_limit_write, None)
+
+
+async def test_batch_clear_dedupes_ids_in_one_call() -> None:
+    session_service = _FakeSessionService()
+    agent_service = _FakeAgentService()
+
+    response = await _batch(
+        {"op": "clear", "session_ids": ["s1", "s2", "s1"]},
+        session_service=session_service,
+        agent_service=agent_service,
+    )
+    body = response.json()
+
+    assert response.status_code == 200
+    assert body["data"] == {"succeeded": ["s1", "s2"], "failed": []}
+    assert session_service.calls == [
+        (
+            "clear_unread_message_counts",
+            {"session_ids": ["s1", "s2"], "user_id": "test-user", "is_admin": False},
+        )
+    ]
+    assert agent_service.calls == []
+
+
+async def test_batch_delete_reports_per_session_results() -> None:
+    session_service = _FakeSessionService(failing_ids=("s2",))
+    agent_service = _FakeAgentService()
+
+    response = await _batch(
+        {"op": "delete", "session_ids": ["s1", "s2", "s3"]},
+        session_service=session_service,
+        agent_service=agent_service,
+    )
+    body = response.json()
+
+    assert response.status_code == 200
+    assert body["msg"] == "批量删除任务会话部分失败"
+    assert body["data"] == {
+        "succeeded": ["s1", "s3"],
+        "failed": [{"session_id": "s2", "msg": "会话正在运行"}],
+    }
+    assert [name for name, _ in session_service.calls] == [
+        "check_sessions_access",
+        "delete_session",
+        "delete_session",
+        "delete_session",
+    ]
+
+
+async def test_batch_stop_uses_injected_agent_service() -> None:
+    session_service = _FakeSessionService()
+    agent_service = _FakeAgentService(failing_ids=("s1",))
+
+    response = await _batch(
+        {"op": "stop", "session_ids": ["s1", "s2"]},
+        session_service=session_service,
+        agent_service=agent_service,
+    )
+    body = response.json()
+
+    assert response.status_code == 200
+    assert body["data"] == {
+        "succeeded": ["s2"],
+        "failed": [{"session_id": "s1", "msg": "操作失败"}],
+    }
+    assert [kwargs["session_id"] for _, kwargs in agent_service.calls] == [
+        "s1",
+        "s2",
+    ]
+
+
+async def test_batch_rejects_whole_batch_when_any_session_is_forbidden() -> None:
+    session_service = _FakeSessionService(forbidden=True)
+    agent_service = _FakeAgentService()
+
+    response = await _batch(
+        {"op": "delete", "session_ids": ["s1", "s2"]},
+        session_service=session_service,
+        agent_service=agent_service,
+    )
+
+    assert response.status_code == 403
+    assert response.json()["code"] == 403
+    assert [name for name, _ in session_service.calls] == ["check_sessions_access"]
+    assert agent_service.calls == []
@@ -0,0 +1,94 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+
+from app.domain.models.session import Session, SessionStatus
+from app.interfaces.endpoints import session_routes
+from app.interfaces.schemas.session import ListSessionItem, ListSessionResponse
+
+
+def _sessions() -> list[Session]:
+    return [
+        Session(
+            id="s1",
+            title="标题",
+            latest_message="hello",
+            latest_message_at=datetime(2026, 1, 2, 3, 4, 5, 678000),
+            status=SessionStatus.RUNNING,
+            unread_message_count=2,
+        ),
+        Session(
+            id="s2",
+            latest_message_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        ),
+        Session(id="s3"),
+    ]
+
+
+def test_dump_sessions_payload_matches_pydantic_serialization() -> None:
+    sessions = _sessions()
+    expected = ListSessionResponse(
+        sessions=[
+            ListSessionItem(
+                session_id=session.id,
+                title=session.title,
+                latest_message=session.latest_message,
+                latest_message_at=session.latest_message_at,
+                status=session.status,
+                unread_message_count=session.unread_message_count,
+            )
+            for session in sessions
+        ]
+    ).model_dump_json()
+
+    payload = session_routes._dump_sessions_payload(sessions)
+
+    assert json.loads(payload) == json.loads(expected)
+
+
+def test_build_session_items_keeps_session_fields() -> None:
+    items = session_routes._build_session_items(_sessions())
+
+    assert [item.session_id for item in items] == ["s1", "s2", "s3"]
+    assert items[0].status == SessionStatus.RUNNING
+    assert items[0].unread_message_count == 2
+    assert items[2].latest_message_at is None
+
+
+def test_sessions_snapshot_changes_only_when_pushed_fields_change() -> None:
+    sessions = _sessions()
+    snapshot = session_routes._sessions_snapshot(sessions)
+
+    assert session_routes._sessions_snapshot(_sessions()) == snapshot
+
+    sessions[1].unread_message_count = 1
+    assert session_routes._sessions_snapshot(sessions) != snapshot
+
+
+def test_get_all_sessions_coalesced_shares_concurrent_fetches() -> None:
+    class _SessionService:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def get_all_sessions(self, user_id: str, is_admin: bool = False):
+            self.calls += 1
+            await asyncio.sleep(0)
+            return _sessions()
+
+    async def run() -> tuple[int, list, list]:
+        service = _SessionService()
+        session_routes._session_list_cache.clear()
+        try:
+            first, second = await asyncio.gather(
+                session_routes._get_all_sessions_coalesced(service, "u1", False),
+                session_routes._get_all_sessions_coalesced(service, "u1", False),
+            )
+            await session_routes._get_all_sessions_coalesced(service, "u2", False)
+        finally:
+            session_routes._session_list_cache.clear()
+        return service.calls, first, second
+
+    calls, first, second = asyncio.run(run())
+
+    assert calls == 2
+    assert first is second
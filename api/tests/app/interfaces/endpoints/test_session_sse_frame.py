@@ -0,0 +1,115 @@
+from collections import OrderedDict
+
+import orjson
+from app.domain.models.event import MessageEvent, TitleEvent, WaitEvent
+from app.domain.models.session import Session
+from app.interfaces.endpoints import session_routes
+from app.interfaces.schemas.event import EventMapper, encode_sse
+from sse_starlette import ServerSentEvent
+
+
+def test_encode_sse_matches_server_sent_event_encoding() -> None:
+    sse_event = EventMapper.event_to_sse_event(
+        MessageEvent(id="e1", role="assistant", message="你好\n世界")
+    )
+    data = sse_event.data.model_dump_json()
+
+    frame = encode_sse(sse_event)
+
+    assert frame == ServerSentEvent(event="message", data=data).encode()
+    assert encode_sse(sse_event) == frame
+
+
+def test_encode_sse_includes_extra_fields_of_common_event_data() -> None:
+    sse_event = EventMapper.event_to_sse_event(
+        WaitEvent(id="e1", pending_action="install")
+    )
+    data = sse_event.data.model_dump_json()
+
+    assert encode_sse(sse_event) == ServerSentEvent(event="wait", data=data).encode()
+
+
+def test_get_cached_session_event_fragments_only_maps_appended_events(
+    monkeypatch,
+) -> None:
+    mapped: list[str] = []
+    original = session_routes.EventMapper.events_to_sse_events
+
+    def _tracking_events_to_sse_events(events):
+        mapped.extend(event.id for event in events)
+        return original(events)
+
+    monkeypatch.setattr(
+        session_routes.EventMapper,
+        "events_to_sse_events",
+        staticmethod(_tracking_events_to_sse_events),
+    )
+    monkeypatch.setattr(session_routes, "_session_events_cache", OrderedDict())
+    monkeypatch.setattr(session_routes, "_session_events_cache_bytes", 0)
+
+    def _event_ids(fragments) -> list[str]:
+        payload = orjson.loads(orjson.dumps(fragments))
+        return [item["data"]["event_id"] for item in payload]
+
+    session = Session(id="s1", events=[TitleEvent(id="e1", title="a")])
+    first = session_routes._get_cached_session_event_fragments(session)
+
+    session.events.append(TitleEvent(id="e2", title="b"))
+    second = session_routes._get_cached_session_event_fragments(session)
+
+    assert _event_ids(first) == ["e1"]
+    assert _event_ids(second) == ["e1", "e2"]
+    assert mapped == ["e1", "e2"]
+    assert second[0] is first[0]
+
+    session.events = [TitleEvent(id="e3", title="c")]
+    third = session_routes._get_cached_session_event_fragments(session)
+    assert _event_ids(third) == ["e3"]
+
+
+def test_get_cached_session_event_fragments_skips_oversized_sessions(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(session_routes, "_session_events_cache", OrderedDict())
+    monkeypatch.setattr(session_routes, "_session_events_cache_bytes", 0)
+    monkeypatch.setattr(session_routes, "SESSION_EVENTS_CACHE_ENTRY_MAX_BYTES", 10)
+
+    session = Session(id="s1", events=[TitleEvent(id="e1", title="a")])
+    fragments = session_routes._get_cached_session_event_fragments(session)
+
+    assert len(fragments) == 1
+    assert "s1" not in session_routes._session_events_cache
+    assert session_routes._session_events_cache_bytes == 0
+
+
+def test_get_cached_session_event_fragments_evicts_by_total_bytes(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(session_routes, "_session_events_cache", OrderedDict())
+    monkeypatch.setattr(session_routes, "_session_events_cache_bytes", 0)
+
+    first = Session(id="s1", events=[TitleEvent(id="e1", title="a")])
+    session_routes._get_cached_session_event_fragments(first)
+    entry_bytes = session_routes._session_events_cache_bytes
+    monkeypatch.setattr(
+        session_routes, "SESSION_EVENTS_CACHE_MAX_BYTES", entry_bytes + 1
+    )
+
+    second = Session(id="s2", events=[TitleEvent(id="e2", title="b")])
+    session_routes._get_cached_session_event_fragments(second)
+
+    assert list(session_routes._session_events_cache) == ["s2"]
+    assert session_routes._session_events_cache_bytes == entry_bytes
+
+
+def test_evict_session_events_cache_releases_entry_bytes(monkeypatch) -> None:
+    monkeypatch.setattr(session_routes, "_session_events_cache", OrderedDict())
+    monkeypatch.setattr(session_routes, "_session_events_cache_bytes", 0)
+
+    session = Session(id="s1", events=[TitleEvent(id="e1", title="a")])
+    session_routes._get_cached_session_event_fragments(session)
+    session_routes._evict_session_events_cache("s1")
+    session_routes._evict_session_events_cache("missing")
+
+    assert "s1" not in session_routes._session_events_cache
+    assert session_routes._session_events_cache_bytes == 0
@@ -11,6 +11,7 @@ from app.interfaces.endpoints import session_routes
 from app.interfaces.service_dependencies import get_agent_service, get_session_service
 from app.main import app
 from fastapi.testclient import TestClient
+from websockets import ConnectionClosed
 
 
 class _FakeLease:
@@ -135,10 +136,7 @@ def _install_ws_overrides(monkeypatch: pytest.MonkeyPatch) -> _FakeLease:
             raise RuntimeError("token required")
         return _fake_user()
 
-    async def _fake_enforce_request_limit(**kwargs) -> None:
-        return None
-
-    async def _fake_acquire_connection_limit(**kwargs):
+    async def _fake_acquire_limited_connection(**kwargs):
         return lease
 
     monkeypatch.setattr(
@@ -148,13 +146,8 @@ def _install_ws_overrides(monkeypatch: pytest.MonkeyPatch) -> _FakeLease:
     )
     monkeypatch.setattr(
         session_routes,
-        "enforce_request_limit",
-        _fake_enforce_request_limit,
-    )
-    monkeypatch.setattr(
-        session_routes,
-        "acquire_connection_limit",
-        _fake_acquire_connection_limit,
+        "acquire_limited_connection",
+        _fake_acquire_limited_connection,
     )
     return lease
 
@@ -329,3 +322,55 @@ def test_takeover_shell_ws_http_fallback_forwards_resize(
             "rows": 40,
         }
     ]
+
+
+def test_takeover_shell_ws_flushes_queued_output_when_sandbox_closes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _install_ws_overrides(monkeypatch)
+    fake_sandbox = _FakeSandboxWithWsUrl("ws://sandbox.local/api/shell/ws")
+    fake_session_service = _FakeSessionService(fake_sandbox)
+    fake_agent_service = _FakeAgentService()
+    app.dependency_overrides[get_session_service] = lambda: fake_session_service
+    app.dependency_overrides[get_agent_service] = lambda: fake_agent_service
+
+    class _ClosingSandboxWsPeer:
+        def __init__(self) -> None:
+            self.frames: list[Any] = [b"line-1\n", '{"type":"exit"}', b"line-2\n"]
+
+        async def send(self, payload: Any) -> None:
+            return None
+
+        async def recv(self) -> Any:
+            if not self.frames:
+                raise ConnectionClosed(None, None)
+            return self.frames.pop(0)
+
+    class _FakeConnectCtx:
+        async def __aenter__(self) -> _ClosingSandboxWsPeer:
+            return _ClosingSandboxWsPeer()
+
+        async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+            return False
+
+    monkeypatch.setattr(
+        session_routes.websockets, "connect", lambda url: _FakeConnectCtx()
+    )
+
+    try:
+        client = TestClient(app)
+        try:
+            with client.websocket_connect(
+                "/api/sessions/s1/takeover/shell/ws?token=t1&takeover_id=tk_5"
+            ) as ws:
+                connected_status = ws.receive_json()
+                assert connected_status == {"type": "status", "state": "connected"}
+
+                assert ws.receive_bytes() == b"line-1\n"
+                assert ws.receive_text() == '{"type":"exit"}'
+                assert ws.receive_bytes() == b"line-2\n"
+        finally:
+            client.close()
+    finally:
+        app.dependency_overrides.pop(get_session_service, None)
+        app.dependency_overrides.pop(get_agent_service, None)
@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+from app.interfaces.endpoints import session_routes
+
+
+def test_forward_batched_coalesces_backlog_into_single_send() -> None:
+    async def run() -> list[bytes]:
+        frames = [b"a", b"bb", b"ccc"]
+        sent: list[bytes] = []
+        all_sent = asyncio.Event()
+
+        async def receive() -> bytes:
+            if frames:
+                return frames.pop(0)
+            await asyncio.Event().wait()
+            return b""
+
+        async def send(data: bytes) -> None:
+            sent.append(data)
+            if sum(len(item) for item in sent) == 6:
+                all_sent.set()
+
+        task = asyncio.create_task(session_routes._forward_batched(receive, send))
+        await all_sent.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return sent
+
+    assert asyncio.run(run()) == [b"abbccc"]
+
+
+def test_forward_batched_propagates_receive_error() -> None:
+    class _Closed(Exception):
+        pass
+
+    async def receive() -> bytes:
+        raise _Closed()
+
+    async def send(data: bytes) -> None:
+        return None
+
+    with pytest.raises(_Closed):
+        asyncio.run(session_routes._forward_batched(receive, send))
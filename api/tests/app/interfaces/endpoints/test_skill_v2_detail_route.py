@@ -143,3 +143,45 @@ async def test_get_skill_detail_not_found() -> None:
     app.dependency_overrides.pop(get_current_user, None)
 
     assert response.status_code == 404
+
+
+async def test_list_skills_returns_items() -> None:
+    skill = _make_skill()
+    fake_service = AsyncMock()
+    fake_service.list_skills = AsyncMock(return_value=[skill])
+
+    app.dependency_overrides[get_current_user] = _fake_admin
+
+    with patch(
+        "app.interfaces.endpoints.skill_v2_routes._build_skill_service",
+        return_value=fake_service,
+    ):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            response = await client.get("/api/v2/skills")
+
+    app.dependency_overrides.pop(get_current_user, None)
+
+    assert response.status_code == 200
+    items = response.json()["data"]["skills"]
+    assert items == [
+        {
+            "id": "skill-001",
+            "slug": "demo-skill",
+            "name": "Demo Skill",
+            "description": "A demo skill for testing",
+            "version": "1.0.0",
+            "source_type": "local",
+            "source_ref": "/tmp/demo-skill",
+            "runtime_type": "native",
+            "enabled": True,
+            "installed_by": "user-1",
+            "created_at": "2026-01-01T00:00:00",
+            "updated_at": "2026-01-02T00:00:00",
+            "bundle_file_count": 3,
+            "context_ref_count": 1,
+            "last_sync_at": "2026-01-01T00:00:00",
+        }
+    ]
@@ -5,6 +5,7 @@ from app.application.services.status_service import StatusService
 from app.domain.models.health_status import HealthStatus
 from app.domain.models.user import User, UserRole, UserStatus
 from app.interfaces.dependencies.auth import get_current_user
+from app.infrastructure.storage.redis import get_redis
 from app.interfaces.service_dependencies import get_status_service
 from app.main import app
 
@@ -27,6 +28,42 @@ class _FakeStatusService(StatusService):
         ]
 
 
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+
+    async def get(self, key: str):
+        return self.store.get(key)
+
+    async def setex(self, key: str, ttl: int, value: bytes) -> None:
+        self.store[key] = value
+
+
+class _FakeRedisClient:
+    def __init__(self) -> None:
+        self.client = _FakeRedis()
+
+
+class _UnhealthyStatusService(_FakeStatusService):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    async def check_all(self) -> list[HealthStatus]:
+        self.calls += 1
+        return [HealthStatus(service="postgres", status="error", details="down")]
+
+
+class _CountingStatusService(_FakeStatusService):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    async def check_all(self) -> list[HealthStatus]:
+        self.calls += 1
+        return await super().check_all()
+
+
 def _fake_user() -> User:
     return User(
         id="test-user",
@@ -37,8 +74,10 @@ def _fake_user() -> User:
 
 
 async def test_get_status() -> None:
+    redis_client = _FakeRedisClient()
     app.dependency_overrides[get_current_user] = _fake_user
     app.dependency_overrides[get_status_service] = lambda: _FakeStatusService()
+    app.dependency_overrides[get_redis] = lambda: redis_client
     try:
         transport = httpx.ASGITransport(app=app)
         async with httpx.AsyncClient(
@@ -49,11 +88,64 @@ async def test_get_status() -> None:
     finally:
         app.dependency_overrides.pop(get_current_user, None)
         app.dependency_overrides.pop(get_status_service, None)
+        app.dependency_overrides.pop(get_redis, None)
 
     data = response.json()
     assert response.status_code == 200
+    assert "x-health-cache" not in response.headers
+    assert "health:v1" in redis_client.client.store
     assert data["code"] == 200
     assert data["data"] == [
         {"service": "postgres", "status": "ok", "details": ""},
         {"service": "redis", "status": "ok", "details": ""},
     ]
+
+
+async def test_get_status_reuses_cached_result() -> None:
+    status_service = _CountingStatusService()
+    redis_client = _FakeRedisClient()
+    app.dependency_overrides[get_current_user] = _fake_user
+    app.dependency_overrides[get_status_service] = lambda: status_service
+    app.dependency_overrides[get_redis] = lambda: redis_client
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://test",
+        ) as client:
+            first = await client.get("/api/status/")
+            second = await client.get("/api/status/")
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+        app.dependency_overrides.pop(get_status_service, None)
+        app.dependency_overrides.pop(get_redis, None)
+
+    assert status_service.calls == 1
+    assert "x-health-cache" not in first.headers
+    assert second.headers["x-health-cache"] == "hit"
+    assert second.json()["data"] == first.json()["data"]
+
+
+async def test_get_status_does_not_cache_unhealthy_result() -> None:
+    status_service = _UnhealthyStatusService()
+    redis_client = _FakeRedisClient()
+    app.dependency_overrides[get_current_user] = _fake_user
+    app.dependency_overrides[get_status_service] = lambda: status_service
+    app.dependency_overrides[get_redis] = lambda: redis_client
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://test",
+        ) as client:
+            first = await client.get("/api/status/")
+            second = await client.get("/api/status/")
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+        app.dependency_overrides.pop(get_status_service, None)
+        app.dependency_overrides.pop(get_redis, None)
+
+    assert first.json()["code"] == 503
+    assert "x-health-cache" not in second.headers
+    assert status_service.calls == 2
+    assert redis_client.client.store == {}
@@ -1,13 +1,37 @@
+import json
 from datetime import datetime
 
+import orjson
 import pytest
 from app.domain.models.event import (
     ControlAction,
     ControlEvent,
     ControlScope,
     ControlSource,
+    DoneEvent,
+    ErrorEvent,
+    MessageEvent,
+    PlanEvent,
+    SearchToolContent,
+    StepEvent,
+    TitleEvent,
+    ToolEvent,
+    ToolEventStatus,
+    WaitEvent,
 )
-from app.interfaces.schemas.event import ControlSSEEvent, EventMapper
+from app.domain.models.plan import Plan, Step
+from app.domain.models.search import SearchResultItem
+from app.interfaces.schemas.event import (
+    AgentSSEEvent,
+    CommonSSEEvent,
+    ControlSSEEvent,
+    EventMapper,
+    MessageSSEEvent,
+    encode_sse,
+    encode_sse_event_json,
+)
+from app.interfaces.schemas.session import GetSessionResponse
+from pydantic import TypeAdapter
 
 
 def test_event_mapper_maps_control_event_to_control_sse_event() -> None:
@@ -21,7 +45,6 @@ def test_event_mapper_maps_control_event_to_control_sse_event() -> None:
         expires_at=expires_at,
     )
 
-    EventMapper._cache_mapping = None
     sse_event = EventMapper.event_to_sse_event(event)
 
     assert isinstance(sse_event, ControlSSEEvent)
@@ -40,3 +63,86 @@ def test_control_event_requested_requires_scope() -> None:
             action=ControlAction.REQUESTED,
             source=ControlSource.AGENT,
         )
+
+
+def test_message_sse_event_serializes_created_at_as_timestamp() -> None:
+    created_at = datetime(2026, 2, 27, 12, 0, 0)
+    event = MessageEvent(id="evt_1", message="hello", created_at=created_at)
+
+    sse_event = EventMapper.event_to_sse_event(event)
+    payload = json.loads(sse_event.data.model_dump_json())
+
+    assert sse_event.event == "message"
+    assert payload["event_id"] == "evt_1"
+    assert payload["message"] == "hello"
+    assert payload["created_at"] == int(created_at.timestamp())
+
+
+def test_wait_event_maps_scalar_fields_through_generic_path() -> None:
+    event = WaitEvent(id="evt_wait", pending_action="install")
+
+    sse_event = EventMapper.event_to_sse_event(event)
+    payload = json.loads(sse_event.data.model_dump_json())
+
+    assert sse_event.event == "wait"
+    assert payload["event_id"] == "evt_wait"
+    assert payload["pending_action"] == "install"
+    assert "id" not in payload
+    assert "type" not in payload
+
+
+def test_get_session_response_dispatches_events_by_tag() -> None:
+    response = GetSessionResponse.model_validate(
+        {
+            "session_id": "s_1",
+            "status": "completed",
+            "events": [
+                {"event": "message", "data": {"message": "hi"}},
+                {"event": "custom", "data": {"foo": "bar"}},
+            ],
+        }
+    )
+
+    assert isinstance(response.events[0], MessageSSEEvent)
+    assert isinstance(response.events[1], CommonSSEEvent)
+    assert response.events[1].data.foo == "bar"
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        MessageEvent(message="hello"),
+        TitleEvent(title="标题"),
+        StepEvent(step=Step(id="step_1", description="搜索")),
+        PlanEvent(plan=Plan(steps=[Step(id="step_1"), Step(id="step_2")])),
+        ToolEvent(
+            tool_call_id="call_1",
+            tool_name="search",
+            function_name="search_web",
+            function_args={"query": "actus"},
+            tool_content=SearchToolContent(
+                results=[SearchResultItem(url="https://example.com", title="示例")]
+            ),
+            status=ToolEventStatus.CALLED,
+        ),
+        DoneEvent(),
+        ErrorEvent(error="boom"),
+        WaitEvent(pending_action="install"),
+        ControlEvent(
+            action=ControlAction.REQUESTED,
+            scope=ControlScope.SHELL,
+            expires_at=datetime(2026, 2, 27, 12, 0, 0),
+        ),
+    ],
+    ids=lambda event: event.type,
+)
+def test_encoded_sse_payload_matches_agent_sse_event_json(event) -> None:
+    sse_event = EventMapper.event_to_sse_event(event)
+    expected = orjson.loads(TypeAdapter(AgentSSEEvent).dump_json(sse_event))
+
+    assert orjson.loads(encode_sse_event_json(sse_event)) == expected
+
+    prefix = f"event: {sse_event.event}\r\ndata: ".encode()
+    frame = encode_sse(sse_event)
+    assert frame.startswith(prefix)
+    assert orjson.loads(frame[len(prefix) : -4]) == expected["data"]
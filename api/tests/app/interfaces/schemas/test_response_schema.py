@@ -23,3 +23,9 @@ def test_response_fail_default_data_is_none() -> None:
     assert response.code == 500
     assert response.msg == "登录失败"
     assert response.data is None
+
+
+def test_response_success_without_data_serializes_full_envelope() -> None:
+    response = Response.success(msg="设置成功")
+
+    assert response.model_dump() == {"code": 200, "msg": "设置成功", "data": None}
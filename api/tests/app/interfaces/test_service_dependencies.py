@@ -62,6 +62,7 @@ def test_get_agent_service_builds_context_overflow_config_from_llm(monkeypatch)
         skill_risk_policy=SkillRiskPolicy(),
     )
 
+    monkeypatch.setattr(service_dependencies, "_app_config_cache", None)
     monkeypatch.setattr(
         service_dependencies,
         "FileAppConfigRepository",
@@ -104,6 +105,7 @@ def test_get_agent_service_builds_dedicated_summary_llm(monkeypatch) -> None:
         skill_risk_policy=SkillRiskPolicy(),
     )
 
+    monkeypatch.setattr(service_dependencies, "_app_config_cache", None)
     monkeypatch.setattr(
         service_dependencies,
         "FileAppConfigRepository",
@@ -118,3 +120,77 @@ def test_get_agent_service_builds_dedicated_summary_llm(monkeypatch) -> None:
 
     assert isinstance(summary_llm, _FakeLLM)
     assert summary_llm.llm_config.model_name == "gpt-4o-mini"
+
+
+def test_get_cached_app_config_reuses_parsed_config_until_file_changes(
+    monkeypatch, tmp_path
+) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("llm_config: {}\n", encoding="utf-8")
+    loads: list[AppConfig] = []
+
+    class _CountingAppConfigRepository:
+        def __init__(self, *args, **kwargs) -> None:
+            pass
+
+        def load(self) -> AppConfig:
+            app_config = AppConfig(
+                llm_config=LLMConfig(),
+                agent_config=AgentConfig(),
+                mcp_config=MCPConfig(),
+                a2a_config=A2AConfig(),
+            )
+            loads.append(app_config)
+            return app_config
+
+    monkeypatch.setattr(service_dependencies, "_app_config_cache", None)
+    monkeypatch.setattr(
+        service_dependencies.settings, "app_config_filepath", str(config_path)
+    )
+    monkeypatch.setattr(
+        service_dependencies, "FileAppConfigRepository", _CountingAppConfigRepository
+    )
+
+    first = service_dependencies._get_cached_app_config()
+    second = service_dependencies._get_cached_app_config()
+    assert first is second
+    assert len(loads) == 1
+
+    config_path.write_text("llm_config: {}\nagent_config: {}\n", encoding="utf-8")
+    third = service_dependencies._get_cached_app_config()
+    assert third is not first
+    assert len(loads) == 2
+
+
+def test_get_agent_service_reuses_llm_and_stateless_collaborators(monkeypatch) -> None:
+    app_config = AppConfig(
+        llm_config=LLMConfig(
+            base_url="https://api.openai.com/v1",
+            api_key="key",
+            model_name="gpt-4o",
+        ),
+        agent_config=AgentConfig(),
+        mcp_config=MCPConfig(),
+        a2a_config=A2AConfig(),
+        skill_risk_policy=SkillRiskPolicy(),
+    )
+
+    monkeypatch.setattr(service_dependencies, "_app_config_cache", None)
+    monkeypatch.setattr(service_dependencies, "_llm_cache", None)
+    monkeypatch.setattr(
+        service_dependencies, "_get_cached_app_config", lambda: app_config
+    )
+    monkeypatch.setattr(service_dependencies, "OpenAILLM", _FakeLLM)
+    monkeypatch.setattr(service_dependencies, "MinioFileStorage", _FakeFileStorage)
+    monkeypatch.setattr(service_dependencies, "AgentService", _CapturedAgentService)
+    minio_store = object()
+
+    first = service_dependencies.get_agent_service(minio_store=minio_store)
+    second = service_dependencies.get_agent_service(minio_store=minio_store)
+
+    for key in ("llm", "file_storage", "json_parser", "search_engine"):
+        assert first.kwargs[key] is second.kwargs[key]
+    # 每个服务拿到独立的配置副本，不共享可变的缓存配置
+    assert first.kwargs["agent_config"] == app_config.agent_config
+    assert first.kwargs["agent_config"] is not app_config.agent_config
+    assert first.kwargs["agent_config"] is not second.kwargs["agent_config"]
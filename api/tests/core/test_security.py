@@ -1,5 +1,61 @@
-from core.security import verify_password
+import asyncio
+import time
+from datetime import timedelta
+
+import jwt
+from core import security
+from core.security import (
+    aget_password_hash,
+    averify_password,
+    create_access_token,
+    decode_token,
+    verify_password,
+)
+
+
+def test_security_constants_derive_from_cached_settings() -> None:
+    assert security.get_settings() is security.settings
+    assert security._JWT_SECRET_KEY_BYTES == (
+        security.settings.jwt_secret_key.encode("utf-8")
+    )
 
 
 def test_verify_password_returns_false_for_invalid_hash() -> None:
     assert verify_password("123456", "plain-text-password") is False
+
+
+def test_async_password_helpers_round_trip() -> None:
+    async def _round_trip() -> tuple[bool, bool]:
+        hashed = await aget_password_hash("123456")
+        return (
+            await averify_password("123456", hashed),
+            await averify_password("654321", hashed),
+        )
+
+    assert asyncio.run(_round_trip()) == (True, False)
+
+
+def test_access_token_exp_is_numeric_date() -> None:
+    before = int(time.time())
+    token = create_access_token({"sub": "u1"}, expires_delta=timedelta(minutes=5))
+
+    payload = decode_token(token)
+
+    assert payload is not None
+    assert payload["type"] == "access"
+    assert before + 300 <= payload["exp"] <= int(time.time()) + 300
+
+
+def test_decode_token_rejects_tampered_or_expired_tokens() -> None:
+    token = create_access_token({"sub": "u1"})
+    header, payload, signature = token.split(".")
+    forged_payload = jwt.utils.base64url_encode(b'{"sub":"admin"}').decode()
+
+    assert decode_token(f"{header}.{forged_payload}.{signature}") is None
+    assert decode_token(f"{header}.{payload}.") is None
+    assert decode_token(token + "x") is None
+    assert decode_token("not-a-token") is None
+    assert (
+        decode_token(create_access_token({"sub": "u1"}, timedelta(seconds=-1)))
+        is None
+    )